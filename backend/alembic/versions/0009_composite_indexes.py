@@ -0,0 +1,40 @@
+"""add composite indexes for per-user lookups
+
+Revision ID: 0009_composite_indexes
+Revises: 0008_task_alert_time
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0009_composite_indexes"
+down_revision = "0008_task_alert_time"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_budget_months_user_period", "budget_months", ["user_id", "year", "month"]),
+    ("ix_categories_user_active", "categories", ["user_id", "is_active"]),
+    (
+        "ix_category_limits_user_category_period",
+        "category_limits",
+        ["user_id", "category_id", "year", "month"],
+    ),
+    ("ix_budget_income_sources_budget_month", "budget_income_sources", ["budget_month_id"]),
+    ("ix_debts_user_active", "debts", ["user_id", "is_active"]),
+    ("ix_expenses_user_date", "expenses", ["user_id", "date"]),
+    ("ix_expenses_user_category", "expenses", ["user_id", "category_id"]),
+    ("ix_alerts_user_code_period", "alerts", ["user_id", "code", "year", "month"]),
+    ("ix_alerts_user_period", "alerts", ["user_id", "year", "month"]),
+    ("ix_tasks_user_due_date", "tasks", ["user_id", "due_date"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,77 @@
+"""add expense month rollups
+
+Revision ID: 0010_expense_month_rollups
+Revises: 0009_composite_indexes
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010_expense_month_rollups"
+down_revision = "0009_composite_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "expense_month_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.Column("total", sa.Float(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.UniqueConstraint(
+            "user_id",
+            "year",
+            "month",
+            "category_id",
+            name="uq_expense_month_rollups_user_period_category",
+        ),
+    )
+
+    expenses = sa.table(
+        "expenses",
+        sa.column("id", sa.Integer()),
+        sa.column("user_id", sa.Integer()),
+        sa.column("category_id", sa.Integer()),
+        sa.column("amount", sa.Float()),
+        sa.column("date", sa.Date()),
+    )
+    rollups = sa.table(
+        "expense_month_rollups",
+        sa.column("user_id", sa.Integer()),
+        sa.column("year", sa.Integer()),
+        sa.column("month", sa.Integer()),
+        sa.column("category_id", sa.Integer()),
+        sa.column("total", sa.Float()),
+        sa.column("count", sa.Integer()),
+        sa.column("updated_at", sa.DateTime()),
+    )
+    year = sa.cast(sa.extract("year", expenses.c.date), sa.Integer())
+    month = sa.cast(sa.extract("month", expenses.c.date), sa.Integer())
+    backfill = sa.select(
+        expenses.c.user_id,
+        year,
+        month,
+        expenses.c.category_id,
+        sa.func.sum(expenses.c.amount),
+        sa.func.count(expenses.c.id),
+        sa.func.current_timestamp(),
+    ).group_by(expenses.c.user_id, year, month, expenses.c.category_id)
+    op.execute(
+        rollups.insert().from_select(
+            ["user_id", "year", "month", "category_id", "total", "count", "updated_at"],
+            backfill,
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("expense_month_rollups")
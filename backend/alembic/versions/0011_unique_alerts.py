@@ -0,0 +1,34 @@
+"""make alerts unique per user, code and month
+
+Revision ID: 0011_unique_alerts
+Revises: 0010_expense_month_rollups
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0011_unique_alerts"
+down_revision = "0010_expense_month_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Task alerts used to share one code; give existing rows distinct codes first.
+    op.execute("UPDATE alerts SET code = 'TASK_ALERT-' || id WHERE code = 'TASK_ALERT'")
+    op.execute(
+        "DELETE FROM alerts WHERE id NOT IN ("
+        "SELECT MIN(id) FROM alerts GROUP BY user_id, code, year, month)"
+    )
+    op.drop_index("ix_alerts_user_code_period", table_name="alerts")
+    op.create_index(
+        "uq_alerts_user_code_period",
+        "alerts",
+        ["user_id", "code", "year", "month"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_alerts_user_code_period", table_name="alerts")
+    op.create_index("ix_alerts_user_code_period", "alerts", ["user_id", "code", "year", "month"])
@@ -0,0 +1,37 @@
+"""add keyset pagination indexes
+
+Revision ID: 0012_pagination_indexes
+Revises: 0011_unique_alerts
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0012_pagination_indexes"
+down_revision = "0011_unique_alerts"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_users_created_at", "users", ["created_at", "id"]),
+    (
+        "ix_alerts_user_period_created_at",
+        "alerts",
+        ["user_id", "year", "month", "created_at", "id"],
+    ),
+    ("ix_tasks_user_created_at", "tasks", ["user_id", "created_at", "id"]),
+    ("ix_suggestions_created_at", "suggestions", ["created_at", "id"]),
+    ("ix_password_reset_requests_created_at", "password_reset_requests", ["created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+    op.drop_index("ix_alerts_user_period", table_name="alerts")
+
+
+def downgrade() -> None:
+    op.create_index("ix_alerts_user_period", "alerts", ["user_id", "year", "month"])
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
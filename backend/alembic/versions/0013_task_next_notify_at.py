@@ -0,0 +1,79 @@
+"""add precomputed task next_notify_at
+
+Revision ID: 0013_task_next_notify_at
+Revises: 0012_pagination_indexes
+Create Date: 2026-10-18
+"""
+
+from datetime import datetime, time, timedelta
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013_task_next_notify_at"
+down_revision = "0012_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+BACKFILL_CHUNK_SIZE = 1000
+DEFAULT_ALERT_TIME = time(hour=9, minute=0)
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("next_notify_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_tasks_next_notify_at", "tasks", ["next_notify_at"])
+
+    tasks = sa.table(
+        "tasks",
+        sa.column("id", sa.Integer()),
+        sa.column("due_date", sa.Date()),
+        sa.column("alert_time", sa.Time()),
+        sa.column("alert_offset_minutes", sa.Integer()),
+        sa.column("last_alerted_at", sa.DateTime()),
+        sa.column("status", sa.String()),
+        sa.column("next_notify_at", sa.DateTime()),
+    )
+    update = (
+        tasks.update()
+        .where(tasks.c.id == sa.bindparam("task_id"))
+        .values(next_notify_at=sa.bindparam("notify_at"))
+    )
+
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(
+                tasks.c.id,
+                tasks.c.due_date,
+                tasks.c.alert_time,
+                tasks.c.alert_offset_minutes,
+                tasks.c.last_alerted_at,
+            )
+            .where(
+                tasks.c.id > last_id,
+                tasks.c.due_date.isnot(None),
+                tasks.c.alert_offset_minutes.isnot(None),
+                tasks.c.status != "completed",
+            )
+            .order_by(tasks.c.id)
+            .limit(BACKFILL_CHUNK_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        params = []
+        for task_id, due_date, alert_time, offset, last_alerted_at in rows:
+            notify_at = datetime.combine(due_date, alert_time or DEFAULT_ALERT_TIME) - timedelta(
+                minutes=offset
+            )
+            if last_alerted_at is None or last_alerted_at < notify_at:
+                params.append({"task_id": task_id, "notify_at": notify_at})
+        if params:
+            bind.execute(update, params)
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_next_notify_at", table_name="tasks")
+    op.drop_column("tasks", "next_notify_at")
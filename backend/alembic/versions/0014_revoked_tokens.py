@@ -0,0 +1,32 @@
+"""add revoked tokens
+
+Revision ID: 0014_revoked_tokens
+Revises: 0013_task_next_notify_at
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0014_revoked_tokens"
+down_revision = "0013_task_next_notify_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("jti", sa.String(length=64), nullable=True, unique=True),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("issued_before", sa.DateTime(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_revoked_tokens_expires_at", table_name="revoked_tokens")
+    op.drop_table("revoked_tokens")
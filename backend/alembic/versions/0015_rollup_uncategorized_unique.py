@@ -0,0 +1,75 @@
+"""unique uncategorized expense rollups
+
+Revision ID: 0015_rollup_uncategorized_unique
+Revises: 0014_revoked_tokens
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0015_rollup_uncategorized_unique"
+down_revision = "0014_revoked_tokens"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Uncategorized rows could be duplicated by concurrent writes before this
+    # index existed; rebuild them from expenses before enforcing uniqueness.
+    op.execute("DELETE FROM expense_month_rollups WHERE category_id IS NULL")
+
+    expenses = sa.table(
+        "expenses",
+        sa.column("id", sa.Integer()),
+        sa.column("user_id", sa.Integer()),
+        sa.column("category_id", sa.Integer()),
+        sa.column("amount", sa.Float()),
+        sa.column("date", sa.Date()),
+    )
+    rollups = sa.table(
+        "expense_month_rollups",
+        sa.column("user_id", sa.Integer()),
+        sa.column("year", sa.Integer()),
+        sa.column("month", sa.Integer()),
+        sa.column("category_id", sa.Integer()),
+        sa.column("total", sa.Float()),
+        sa.column("count", sa.Integer()),
+        sa.column("updated_at", sa.DateTime()),
+    )
+    year = sa.cast(sa.extract("year", expenses.c.date), sa.Integer())
+    month = sa.cast(sa.extract("month", expenses.c.date), sa.Integer())
+    backfill = (
+        sa.select(
+            expenses.c.user_id,
+            year,
+            month,
+            expenses.c.category_id,
+            sa.func.sum(expenses.c.amount),
+            sa.func.count(expenses.c.id),
+            sa.func.current_timestamp(),
+        )
+        .where(expenses.c.category_id.is_(None))
+        .group_by(expenses.c.user_id, year, month, expenses.c.category_id)
+    )
+    op.execute(
+        rollups.insert().from_select(
+            ["user_id", "year", "month", "category_id", "total", "count", "updated_at"],
+            backfill,
+        )
+    )
+
+    op.create_index(
+        "uq_expense_month_rollups_user_period_uncategorized",
+        "expense_month_rollups",
+        ["user_id", "year", "month"],
+        unique=True,
+        sqlite_where=sa.text("category_id IS NULL"),
+        postgresql_where=sa.text("category_id IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "uq_expense_month_rollups_user_period_uncategorized", table_name="expense_month_rollups"
+    )
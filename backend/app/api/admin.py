@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models
 from app.api.deps import get_current_user, require_admin
-from app.core.security import create_access_token, hash_password
+from app.api.pagination import paginate
+from app.core.security import create_access_token, hash_password, password_hasher
 from app.db import get_db
 from app.schemas import (
     AdminImpersonateRequest,
@@ -14,16 +15,24 @@ from app.schemas import (
     SuggestionOut,
 )
 from app.services.currency import get_currency
+from app.services.principal_cache import invalidate_principal, principal_cache_stats
+from app.services.summary_cache import bump_user_version, summary_cache_stats
+from app.services.token_revocation import revocation_store
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 @router.get("/users", response_model=list[AdminUserOut])
 def list_users(
+    response: Response,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     _: models.User = Depends(require_admin),
 ):
-    return db.query(models.User).order_by(models.User.created_at.desc()).all()
+    return paginate(
+        db.query(models.User), response, [models.User.created_at, models.User.id], cursor, limit
+    )
 
 
 @router.post("/impersonate")
@@ -35,16 +44,25 @@ def impersonate(
     user = db.query(models.User).filter(models.User.id == payload.user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    token = create_access_token(user.username)
+    token = create_access_token(user.username, user_id=user.id)
     return {"access_token": token}
 
 
 @router.get("/suggestions", response_model=list[SuggestionOut])
 def list_suggestions(
+    response: Response,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     _: models.User = Depends(require_admin),
 ):
-    return db.query(models.Suggestion).order_by(models.Suggestion.created_at.desc()).all()
+    return paginate(
+        db.query(models.Suggestion),
+        response,
+        [models.Suggestion.created_at, models.Suggestion.id],
+        cursor,
+        limit,
+    )
 
 
 @router.patch("/users/{user_id}", response_model=AdminUserOut)
@@ -62,6 +80,7 @@ def update_user(
         user.currency = get_currency(payload.country)
     db.commit()
     db.refresh(user)
+    invalidate_principal(user.username)
     return user
 
 
@@ -80,6 +99,7 @@ def delete_user(
     ).delete()
     db.query(models.Suggestion).filter(models.Suggestion.user_id == user_id).delete()
     db.query(models.CategoryLimit).filter(models.CategoryLimit.user_id == user_id).delete()
+    db.query(models.ExpenseMonthRollup).filter(models.ExpenseMonthRollup.user_id == user_id).delete()
     db.query(models.Expense).filter(models.Expense.user_id == user_id).delete()
     db.query(models.Alert).filter(models.Alert.user_id == user_id).delete()
     db.query(models.Task).filter(models.Task.user_id == user_id).delete()
@@ -92,20 +112,44 @@ def delete_user(
         ).delete()
     db.query(models.BudgetMonth).filter(models.BudgetMonth.user_id == user_id).delete()
 
+    username = user.username
     db.delete(user)
+    revocation_store.revoke_user_tokens(db, user_id)
     db.commit()
+    bump_user_version(user_id)
+    invalidate_principal(username)
     return {"status": "ok"}
 
 
+@router.get("/summary-cache")
+def get_summary_cache_stats(_: models.User = Depends(require_admin)):
+    return summary_cache_stats()
+
+
+@router.get("/password-hashing")
+def get_password_hashing_stats(_: models.User = Depends(require_admin)):
+    return password_hasher.stats()
+
+
+@router.get("/principal-cache")
+def get_principal_cache_stats(_: models.User = Depends(require_admin)):
+    return principal_cache_stats()
+
+
 @router.get("/password-resets", response_model=list[PasswordResetRequestOut])
 def list_password_resets(
+    response: Response,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     _: models.User = Depends(require_admin),
 ):
-    return (
-        db.query(models.PasswordResetRequest)
-        .order_by(models.PasswordResetRequest.created_at.desc())
-        .all()
+    return paginate(
+        db.query(models.PasswordResetRequest),
+        response,
+        [models.PasswordResetRequest.created_at, models.PasswordResetRequest.id],
+        cursor,
+        limit,
     )
 
 
@@ -125,5 +169,7 @@ def admin_reset_password(
 
     user.password_hash = hash_password(payload.new_password)
     req.status = "closed"
+    revocation_store.revoke_user_tokens(db, user.id)
     db.commit()
+    invalidate_principal(user.username)
     return {"status": "ok"}
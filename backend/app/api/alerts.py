@@ -1,33 +1,30 @@
-﻿from fastapi import APIRouter, Depends, HTTPException
+﻿from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models
 from app.api.deps import get_current_user
+from app.api.pagination import paginate
 from app.db import get_db
 from app.schemas import AlertOut
 from app.services.budget import get_month_context
+from app.services.read_queries import ALERT_PAGE_COLUMNS, alerts_query
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
 
 @router.get("", response_model=list[AlertOut])
 def list_alerts(
+    response: Response,
     year: int | None = None,
     month: int | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     year, month = get_month_context(year, month)
-    return (
-        db.query(models.Alert)
-        .filter(
-            models.Alert.user_id == current_user.id,
-            models.Alert.year == year,
-            models.Alert.month == month,
-        )
-        .order_by(models.Alert.created_at.desc())
-        .all()
-    )
+    query = alerts_query(db, current_user.id, year, month)
+    return paginate(query, response, ALERT_PAGE_COLUMNS, cursor, limit)
 
 
 @router.patch("/{alert_id}")
@@ -0,0 +1,113 @@
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+from app.api.deps import get_current_user_async
+from app.api.pagination import paginate
+from app.db import get_async_db
+from app.schemas import AlertOut, BudgetSummary, DebtOut, ExpenseOut, TaskOut
+from app.services.budget import compute_suggested_debt_payment, get_month_context
+from app.services.read_queries import (
+    ALERT_PAGE_COLUMNS,
+    EXPENSE_PAGE_COLUMNS,
+    TASK_PAGE_COLUMNS,
+    alerts_query,
+    debts_query,
+    expenses_query,
+    tasks_query,
+)
+from app.services.summary_cache import get_budget_summary
+
+# Async counterparts of the hottest read endpoints, mounted ahead of the sync
+# routers when DB_ASYNC_ENABLED is set. The services and list queries shared
+# with the sync routers run through AsyncSession.run_sync, so they execute on
+# the async driver without occupying a threadpool worker.
+router = APIRouter(tags=["async"])
+
+
+@router.get("/budget/summary", response_model=BudgetSummary)
+async def get_summary(
+    year: int | None = None,
+    month: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user_async),
+):
+    year, month = get_month_context(year, month)
+    summary = await db.run_sync(get_budget_summary, current_user.id, year, month)
+    summary["planned_debt_payment"] = await db.run_sync(
+        compute_suggested_debt_payment, current_user.id, summary["planned_debt_payment"]
+    )
+    return summary
+
+
+@router.get("/expenses", response_model=list[ExpenseOut])
+async def list_expenses(
+    response: Response,
+    year: int | None = None,
+    month: int | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user_async),
+):
+    year, month = get_month_context(year, month)
+    return await db.run_sync(
+        lambda session: paginate(
+            expenses_query(session, current_user.id, year, month),
+            response,
+            EXPENSE_PAGE_COLUMNS,
+            cursor,
+            limit,
+        )
+    )
+
+
+@router.get("/tasks", response_model=list[TaskOut])
+async def list_tasks(
+    response: Response,
+    year: int | None = Query(default=None),
+    month: int | None = Query(default=None),
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user_async),
+):
+    return await db.run_sync(
+        lambda session: paginate(
+            tasks_query(session, current_user.id, year, month),
+            response,
+            TASK_PAGE_COLUMNS,
+            cursor,
+            limit,
+        )
+    )
+
+
+@router.get("/alerts", response_model=list[AlertOut])
+async def list_alerts(
+    response: Response,
+    year: int | None = None,
+    month: int | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user_async),
+):
+    year, month = get_month_context(year, month)
+    return await db.run_sync(
+        lambda session: paginate(
+            alerts_query(session, current_user.id, year, month),
+            response,
+            ALERT_PAGE_COLUMNS,
+            cursor,
+            limit,
+        )
+    )
+
+
+@router.get("/debts", response_model=list[DebtOut])
+async def list_debts(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(get_current_user_async),
+):
+    return await db.run_sync(lambda session: debts_query(session, current_user.id).all())
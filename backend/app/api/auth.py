@@ -1,11 +1,11 @@
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_token_from_request
 from app.core.config import get_settings
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import create_access_token, decode_access_token, hash_password, verify_password
 from app.db import get_db
 from app import models
 from app.schemas import (
@@ -18,6 +18,8 @@ from app.schemas import (
 )
 from app.services.budget import ensure_default_categories
 from app.services.currency import get_currency
+from app.services.principal_cache import invalidate_principal
+from app.services.token_revocation import revocation_store
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -51,7 +53,7 @@ def login(payload: AuthLogin, response: Response, db: Session = Depends(get_db))
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     settings = get_settings()
-    token = create_access_token(user.username)
+    token = create_access_token(user.username, user_id=user.id)
     max_age = int(timedelta(minutes=settings.access_token_expire_minutes).total_seconds())
     response.set_cookie(
         key="access_token",
@@ -66,7 +68,12 @@ def login(payload: AuthLogin, response: Response, db: Session = Depends(get_db))
 
 
 @router.post("/logout")
-def logout(response: Response):
+def logout(request: Request, response: Response, db: Session = Depends(get_db)):
+    token = get_token_from_request(request)
+    payload = decode_access_token(token) if token else None
+    if payload:
+        revocation_store.revoke_token(db, payload)
+        db.commit()
     response.delete_cookie("access_token")
     return {"status": "ok"}
 
@@ -86,6 +93,7 @@ def change_password(
         raise HTTPException(status_code=400, detail="Current password is incorrect")
     current_user.password_hash = hash_password(payload.new_password)
     db.commit()
+    invalidate_principal(current_user.username)
     return {"status": "ok"}
 
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app import models
@@ -10,16 +10,19 @@ from app.schemas import (
     BudgetMonthOut,
     BudgetSalaryIn,
     BudgetSummary,
+    BudgetTrendMonth,
 )
 from app.services.budget import (
-    compute_budget_summary,
+    compute_budget_trend,
     compute_suggested_debt_payment,
+    get_debt_minimum_total,
     get_month_context,
     upsert_salary,
     replace_income_sources_for_month,
 )
-from app.services.alerts import maybe_create_alerts
+from app.services.alert_queue import schedule_alerts
 from app.services.category_limits import get_monthly_limits, upsert_category_limit
+from app.services.summary_cache import bump_user_version, get_budget_summary
 
 router = APIRouter(prefix="/budget", tags=["budget"])
 
@@ -35,7 +38,8 @@ def set_salary(
         db, current_user.id, year, month, payload.salary, payload.other_income
     )
     replace_income_sources_for_month(db, record.id, payload.income_sources)
-    maybe_create_alerts(db, current_user.id, year, month)
+    bump_user_version(current_user.id)
+    schedule_alerts(db, current_user.id, year, month)
     return record
 
 
@@ -47,13 +51,52 @@ def get_summary(
     current_user: models.User = Depends(get_current_user),
 ):
     year, month = get_month_context(year, month)
-    summary = compute_budget_summary(db, current_user.id, year, month)
+    summary = get_budget_summary(db, current_user.id, year, month)
     summary["planned_debt_payment"] = compute_suggested_debt_payment(
         db, current_user.id, summary["planned_debt_payment"]
     )
     return summary
 
 
+MAX_TREND_MONTHS = 120
+
+
+def _parse_month(value: str) -> tuple[int, int]:
+    try:
+        year_text, month_text = value.split("-")
+        year, month = int(year_text), int(month_text)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Months must be formatted as YYYY-MM") from exc
+    if not 1 <= month <= 12:
+        raise HTTPException(status_code=400, detail="Months must be formatted as YYYY-MM")
+    return year, month
+
+
+@router.get("/trend", response_model=list[BudgetTrendMonth])
+def get_trend(
+    start: str = Query(alias="from"),
+    end: str = Query(alias="to"),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    start_month = _parse_month(start)
+    end_month = _parse_month(end)
+    if end_month < start_month:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    span = (end_month[0] - start_month[0]) * 12 + end_month[1] - start_month[1] + 1
+    if span > MAX_TREND_MONTHS:
+        raise HTTPException(status_code=400, detail=f"Trend range is limited to {MAX_TREND_MONTHS} months")
+
+    trend = compute_budget_trend(db, current_user.id, start_month, end_month)
+    debt_minimum_total = None
+    for summary in trend:
+        if summary["planned_debt_payment"] <= 0:
+            if debt_minimum_total is None:
+                debt_minimum_total = get_debt_minimum_total(db, current_user.id)
+            summary["planned_debt_payment"] = debt_minimum_total
+    return trend
+
+
 @router.get("/current", response_model=BudgetCurrentOut)
 def get_current_budget(
     year: int | None = None,
@@ -62,7 +105,7 @@ def get_current_budget(
     current_user: models.User = Depends(get_current_user),
 ):
     year, month = get_month_context(year, month)
-    summary = compute_budget_summary(db, current_user.id, year, month)
+    summary = get_budget_summary(db, current_user.id, year, month)
     salary = summary["salary"]
     other_income = summary["other_income"]
     budget_month = (
@@ -111,6 +154,7 @@ def set_monthly_limits(
             db, current_user.id, item.category_id, payload.year, payload.month, item.monthly_limit
         )
     db.commit()
-    maybe_create_alerts(db, current_user.id, payload.year, payload.month)
+    bump_user_version(current_user.id)
+    schedule_alerts(db, current_user.id, payload.year, payload.month)
     return {"status": "ok"}
 
@@ -7,9 +7,11 @@ from app import models
 from app.api.deps import get_current_user
 from app.db import get_db
 from app.schemas import CategoryCreate, CategoryOut, CategoryUpdate, CategoryDeleteRequest
-from app.services.alerts import maybe_create_alerts
+from app.services.alert_queue import schedule_alerts
 from app.services.budget import ensure_uncategorized, get_month_context
 from app.services.category_limits import upsert_category_limit
+from app.services.expense_rollups import move_category_rollups
+from app.services.summary_cache import bump_user_version
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
@@ -47,9 +49,10 @@ def create_category(
     year, month = get_month_context(None, None)
     upsert_category_limit(db, current_user.id, category.id, year, month, category.monthly_limit)
     db.commit()
+    bump_user_version(current_user.id)
 
     year, month = get_month_context(None, None)
-    maybe_create_alerts(db, current_user.id, year, month)
+    schedule_alerts(db, current_user.id, year, month)
     return category
 
 
@@ -84,7 +87,8 @@ def update_category(
     year, month = get_month_context(None, None)
     upsert_category_limit(db, current_user.id, category.id, year, month, category.monthly_limit)
     db.commit()
-    maybe_create_alerts(db, current_user.id, year, month)
+    bump_user_version(current_user.id)
+    schedule_alerts(db, current_user.id, year, month)
     return category
 
 
@@ -121,12 +125,15 @@ def delete_category(
         models.Expense.user_id == current_user.id,
         models.Expense.category_id == category.id,
     ).update({models.Expense.category_id: replacement.id})
+    if replacement.id != category.id:
+        move_category_rollups(db, current_user.id, category.id, replacement.id)
 
     category.is_active = False
     db.commit()
+    bump_user_version(current_user.id)
 
     year, month = get_month_context(None, None)
-    maybe_create_alerts(db, current_user.id, year, month)
+    schedule_alerts(db, current_user.id, year, month)
 
     return {"status": "ok", "moved_to": replacement.id}
 
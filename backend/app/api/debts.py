@@ -1,11 +1,30 @@
-﻿from fastapi import APIRouter, Depends, HTTPException
+﻿from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app import models
 from app.api.deps import get_current_user
+from app.core.config import get_settings
 from app.db import get_db
-from app.schemas import DebtCreate, DebtOut, DebtUpdate, DebtSimulationRequest, DebtSimulationResult
-from app.services.debt import DebtItem, DebtSimulationError, simulate_payoff
+from app.schemas import (
+    DebtCompareRequest,
+    DebtCompareResult,
+    DebtCreate,
+    DebtMonteCarloRequest,
+    DebtMonteCarloResult,
+    DebtOut,
+    DebtSimulationRequest,
+    DebtSimulationResult,
+    DebtSweepRequest,
+    DebtSweepResult,
+    DebtUpdate,
+)
+from app.services.debt import DebtItem, DebtSimulationError
+from app.services.debt_compare import compare_strategies, simulate_cached, sweep_extra_payments, sweep_points
+from app.services.debt_montecarlo import SimulationBudgetExceeded, simulate_payoff_monte_carlo
+from app.services.debt_schedule import build_schedule_columns, iter_schedule_ndjson, prepare_schedule
+from app.services.read_queries import debts_query
+from app.services.summary_cache import bump_user_version
 
 router = APIRouter(prefix="/debts", tags=["debts"])
 
@@ -15,11 +34,7 @@ def list_debts(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    return (
-        db.query(models.Debt)
-        .filter(models.Debt.user_id == current_user.id, models.Debt.is_active.is_(True))
-        .all()
-    )
+    return debts_query(db, current_user.id).all()
 
 
 @router.post("", response_model=DebtOut)
@@ -31,6 +46,7 @@ def create_debt(
     debt = models.Debt(user_id=current_user.id, **payload.model_dump())
     db.add(debt)
     db.commit()
+    bump_user_version(current_user.id)
     db.refresh(debt)
     return debt
 
@@ -53,6 +69,7 @@ def update_debt(
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(debt, field, value)
     db.commit()
+    bump_user_version(current_user.id)
     db.refresh(debt)
     return debt
 
@@ -72,21 +89,17 @@ def delete_debt(
         raise HTTPException(status_code=404, detail="Debt not found")
     debt.is_active = False
     db.commit()
+    bump_user_version(current_user.id)
     return {"status": "ok"}
 
 
-@router.post("/simulate", response_model=DebtSimulationResult)
-def simulate(
-    payload: DebtSimulationRequest,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
-):
+def _load_debt_items(db: Session, user_id: int) -> list[DebtItem]:
     debts = (
         db.query(models.Debt)
-        .filter(models.Debt.user_id == current_user.id, models.Debt.is_active.is_(True))
+        .filter(models.Debt.user_id == user_id, models.Debt.is_active.is_(True))
         .all()
     )
-    items = [
+    return [
         DebtItem(
             id=d.id,
             name=d.debt_name,
@@ -97,10 +110,107 @@ def simulate(
         )
         for d in debts
     ]
+
+
+@router.post("/simulate", response_model=DebtSimulationResult)
+def simulate(
+    payload: DebtSimulationRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    items = _load_debt_items(db, current_user.id)
     try:
-        result = simulate_payoff(items, payload.strategy, payload.extra_monthly_payment)
+        result = simulate_cached(
+            items,
+            payload.strategy,
+            payload.extra_monthly_payment,
+            engine=payload.engine,
+            order=payload.custom_order,
+        )
     except DebtSimulationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return result
 
+
+@router.post("/compare", response_model=DebtCompareResult)
+def compare(
+    payload: DebtCompareRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    items = _load_debt_items(db, current_user.id)
+    try:
+        strategies = compare_strategies(
+            items, payload.extra_monthly_payment, order=payload.custom_order, engine=payload.engine
+        )
+    except DebtSimulationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return {"strategies": strategies}
+
+
+@router.post("/sweep", response_model=DebtSweepResult)
+def sweep(
+    payload: DebtSweepRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    items = _load_debt_items(db, current_user.id)
+    try:
+        extras = sweep_points(payload.extra_start, payload.extra_stop, payload.extra_step)
+        curves = sweep_extra_payments(items, extras, payload.strategies, engine=payload.engine)
+    except DebtSimulationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return {"extra_monthly_payment": extras, "curves": curves}
+
+
+@router.post("/monte-carlo", response_model=DebtMonteCarloResult)
+def monte_carlo(
+    payload: DebtMonteCarloRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    items = _load_debt_items(db, current_user.id)
+    try:
+        result = simulate_payoff_monte_carlo(
+            items,
+            payload.strategy,
+            payload.extra_monthly_payment,
+            trials=payload.trials,
+            apr_volatility=payload.apr_volatility,
+            extra_volatility=payload.extra_volatility,
+            seed=payload.seed,
+            order=payload.custom_order,
+            cpu_budget_seconds=get_settings().debt_monte_carlo_cpu_seconds,
+        )
+    except SimulationBudgetExceeded as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except DebtSimulationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return result
+
+
+@router.get("/schedule")
+def amortization_schedule(
+    strategy: str = "avalanche",
+    extra_monthly_payment: float = 0,
+    order: list[int] = Query(default=[]),
+    format: str = Query(default="ndjson", pattern="^(ndjson|columns)$"),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    items = _load_debt_items(db, current_user.id)
+    try:
+        items, strategy, rank = prepare_schedule(items, strategy, order)
+    except DebtSimulationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if format == "columns":
+        return build_schedule_columns(items, strategy, extra_monthly_payment, rank)
+    return StreamingResponse(
+        iter_schedule_ndjson(items, strategy, extra_monthly_payment, rank),
+        media_type="application/x-ndjson",
+    )
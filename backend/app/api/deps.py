@@ -1,9 +1,12 @@
 from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.security import decode_access_token
-from app.db import get_db
+from app.db import get_async_db, get_db
 from app import models
+from app.services.principal_cache import cache_principal, get_cached_principal
+from app.services.token_revocation import revocation_store
 
 
 def get_token_from_request(request: Request) -> str | None:
@@ -16,10 +19,7 @@ def get_token_from_request(request: Request) -> str | None:
     return None
 
 
-def get_current_user(
-    request: Request,
-    db: Session = Depends(get_db),
-) -> models.User:
+def _get_token_payload(request: Request) -> dict:
     token = get_token_from_request(request)
     if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -27,13 +27,40 @@ def get_current_user(
     payload = decode_access_token(token)
     if not payload or "sub" not in payload:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    return payload
+
 
-    user = db.query(models.User).filter(models.User.username == payload["sub"]).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+def _resolve_user(db: Session, payload: dict) -> models.User:
+    subject = payload["sub"]
+    user = get_cached_principal(db, subject)
+    if user is None:
+        user = db.query(models.User).filter(models.User.username == subject).first()
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        cache_principal(subject, user)
+
+    # Tokens for a deleted account must not resolve to a new user with the same name.
+    if payload.get("uid") is not None and payload["uid"] != user.id:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    if revocation_store.is_revoked(db, payload, user.id):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
     return user
 
 
+def get_current_user(
+    request: Request,
+    db: Session = Depends(get_db),
+) -> models.User:
+    return _resolve_user(db, _get_token_payload(request))
+
+
+async def get_current_user_async(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> models.User:
+    return await db.run_sync(_resolve_user, _get_token_payload(request))
+
+
 def require_admin(current_user: models.User = Depends(get_current_user)) -> models.User:
     if not current_user.is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin only")
@@ -1,41 +1,71 @@
-﻿from calendar import monthrange
+﻿import codecs
+import csv
+import json
+from collections import deque
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app import models
 from app.api.deps import get_current_user
+from app.api.pagination import paginate
 from app.db import get_db
-from app.schemas import ExpenseCreate, ExpenseOut
-from app.services.alerts import maybe_create_alerts
+from app.schemas import ExpenseBulkResult, ExpenseCreate, ExpenseOut
+from app.services.alert_queue import schedule_alerts
 from app.services.budget import ensure_uncategorized, get_month_context
+from app.services.expense_export import iter_expenses_csv, iter_expenses_ndjson
+from app.services.expense_import import (
+    IMPORT_CHUNK_SIZE,
+    import_expense_chunk,
+    prepare_expense_import,
+)
+from app.services.expense_rollups import record_expense, remove_expense
+from app.services.read_queries import EXPENSE_PAGE_COLUMNS, expenses_query
+from app.services.summary_cache import bump_user_version
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
 
 
 @router.get("", response_model=list[ExpenseOut])
 def list_expenses(
+    response: Response,
     year: int | None = None,
     month: int | None = None,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
     year, month = get_month_context(year, month)
-    start = date(year, month, 1)
-    end = date(year, month, monthrange(year, month)[1])
+    query = expenses_query(db, current_user.id, year, month)
+    return paginate(query, response, EXPENSE_PAGE_COLUMNS, cursor, limit)
 
-    expenses = (
-        db.query(models.Expense)
-        .filter(
-            models.Expense.user_id == current_user.id,
-            models.Expense.date >= start,
-            models.Expense.date <= end,
-        )
-        .order_by(models.Expense.date.desc())
-        .all()
+
+@router.get("/export")
+def export_expenses(
+    start: date,
+    end: date,
+    format: str = Query(default="csv", pattern="^(csv|ndjson)$"),
+    current_user: models.User = Depends(get_current_user),
+):
+    if end < start:
+        raise HTTPException(status_code=400, detail="End date must not be before start date")
+
+    filename = f"expenses-{start.isoformat()}-{end.isoformat()}.{format}"
+    if format == "ndjson":
+        body = iter_expenses_ndjson(current_user.id, start, end)
+        media_type = "application/x-ndjson"
+    else:
+        body = iter_expenses_csv(current_user.id, start, end)
+        media_type = "text/csv"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
-    return expenses
 
 
 @router.post("", response_model=ExpenseOut)
@@ -69,14 +99,110 @@ def create_expense(
         note=payload.note,
     )
     db.add(expense)
+    record_expense(db, expense)
     db.commit()
+    bump_user_version(current_user.id)
     db.refresh(expense)
 
     year, month = get_month_context(payload.date.year, payload.date.month)
-    maybe_create_alerts(db, current_user.id, year, month)
+    schedule_alerts(
+        db, current_user.id, year, month, category_id=category_id, delta=payload.amount
+    )
     return expense
 
 
+class _LineFeed:
+    # Line source for a long-lived csv.reader: it runs dry between request
+    # chunks and is refilled, so the reader keeps its line count throughout.
+    def __init__(self) -> None:
+        self.lines: deque[str] = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+async def _iter_csv_rows(request: Request):
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    header: list[str] | None = None
+    buffer = ""
+    # Lines of a record whose quoted field is still open; they are only handed
+    # to the reader once the record is complete, since it cannot resume a
+    # record across a dry feed.
+    pending: list[str] = []
+    quotes = 0
+
+    def parse():
+        nonlocal header
+        for values in reader:
+            if not values:
+                continue
+            if header is None:
+                header = [value.strip().lower() for value in values]
+                continue
+            yield reader.line_num, dict(zip(header, values))
+
+    async for chunk in request.stream():
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            pending.append(line + "\n")
+            quotes += line.count('"')
+            if quotes % 2:
+                continue
+            feed.lines.extend(pending)
+            pending, quotes = [], 0
+        for row in parse():
+            yield row
+    buffer += decoder.decode(b"", final=True)
+    feed.lines.extend(pending)
+    if buffer:
+        feed.lines.append(buffer)
+    for row in parse():
+        yield row
+
+
+async def _iter_json_rows(request: Request):
+    try:
+        payload = json.loads(await request.body())
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid JSON body") from exc
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of expenses")
+    for index, item in enumerate(payload, start=1):
+        yield index, item if isinstance(item, dict) else {}
+
+
+@router.post("/bulk", response_model=ExpenseBulkResult)
+async def bulk_create_expenses(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    content_type = request.headers.get("content-type", "")
+    rows = _iter_csv_rows(request) if "csv" in content_type else _iter_json_rows(request)
+    context = await run_in_threadpool(prepare_expense_import, db, current_user.id)
+
+    chunk: list[tuple[int, dict]] = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= IMPORT_CHUNK_SIZE:
+            await run_in_threadpool(import_expense_chunk, db, context, chunk)
+            chunk = []
+    if chunk:
+        await run_in_threadpool(import_expense_chunk, db, context, chunk)
+
+    for year, month in sorted(context.months):
+        await run_in_threadpool(schedule_alerts, db, current_user.id, year, month)
+    return {"inserted": context.inserted, "errors": context.errors}
+
+
 @router.delete("/{expense_id}")
 def delete_expense(
     expense_id: int,
@@ -91,7 +217,9 @@ def delete_expense(
     if not expense:
         raise HTTPException(status_code=404, detail="Expense not found")
 
+    remove_expense(db, expense)
     db.delete(expense)
     db.commit()
+    bump_user_version(current_user.id)
     return {"status": "ok"}
 
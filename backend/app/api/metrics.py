@@ -0,0 +1,60 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import get_settings
+from app.core.security import password_hasher
+from app.db import async_engine, async_statement_gauge, engine, statement_gauge
+from app.services.principal_cache import principal_cache_stats
+from app.services.summary_cache import summary_cache_stats
+
+router = APIRouter(tags=["metrics"])
+
+
+def require_metrics_token(authorization: str | None = Header(default=None)) -> None:
+    token = get_settings().metrics_token
+    if not token:
+        return
+    scheme, _, supplied = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(supplied, token):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+
+def _pool_stats(pool) -> dict:
+    stats = {}
+    # Only QueuePool and its async variant track these gauges; in-memory SQLite
+    # runs on SingletonThreadPool, which has no size or overflow.
+    if isinstance(pool, QueuePool):
+        stats = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # QueuePool reports overflow relative to pool_size, so idle pools go negative.
+            "overflow": max(pool.overflow(), 0),
+        }
+    stats.update(getattr(pool, "wait_stats", {}))
+    return stats
+
+
+def _render(prefix: str, stats: dict, labels: str = "") -> list[str]:
+    lines = []
+    for key, value in stats.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        lines.append(f"{prefix}_{key}{labels} {value}")
+    return lines
+
+
+@router.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_token)])
+def metrics():
+    lines = _render("db_pool", _pool_stats(engine.pool), '{engine="sync"}')
+    lines += _render("db", statement_gauge.stats, '{engine="sync"}')
+    if async_engine is not None:
+        lines += _render("db_pool", _pool_stats(async_engine.sync_engine.pool), '{engine="async"}')
+        lines += _render("db", async_statement_gauge.stats, '{engine="async"}')
+    lines += _render("password_hash", password_hasher.stats())
+    lines += _render("summary_cache", summary_cache_stats())
+    lines += _render("principal_cache", principal_cache_stats())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,63 @@
+import base64
+import json
+from datetime import date, datetime
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_
+
+from app.core.config import get_settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, (date, datetime)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: list) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        decoded = []
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            elif python_type is int:
+                value = int(value)
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+def _after(columns: list, values: list):
+    clauses = []
+    for index, column in enumerate(columns):
+        equal = [columns[i] == values[i] for i in range(index)]
+        clauses.append(and_(*equal, column < values[index]))
+    return or_(*clauses)
+
+
+def paginate(query, response: Response, columns: list, cursor: str | None, limit: int | None):
+    ordered = query.order_by(*[column.desc() for column in columns])
+    if cursor is None and limit is None:
+        return ordered.all()
+
+    settings = get_settings()
+    limit = min(limit or settings.page_size_default, settings.page_size_max)
+    if cursor:
+        ordered = ordered.filter(_after(columns, decode_cursor(cursor, columns)))
+    rows = ordered.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            [getattr(last, column.key) for column in columns]
+        )
+    return rows
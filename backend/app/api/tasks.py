@@ -1,14 +1,14 @@
-from datetime import date
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import or_, and_
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models
 from app.api.deps import get_current_user
+from app.api.pagination import paginate
 from app.db import get_db
 from app.schemas import TaskCreate, TaskOut, TaskUpdate
-from app.services.task_alerts import process_task_alerts
+from app.services.read_queries import TASK_PAGE_COLUMNS, tasks_query
+from app.services.task_alerts import refresh_next_notify_at
+from app.services.task_scheduler import task_scheduler
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 VALID_STATUSES = {"pending", "in_progress", "completed", "overdue"}
@@ -16,28 +16,16 @@ VALID_STATUSES = {"pending", "in_progress", "completed", "overdue"}
 
 @router.get("", response_model=list[TaskOut])
 def list_tasks(
+    response: Response,
     year: int | None = Query(default=None),
     month: int | None = Query(default=None),
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    process_task_alerts(db, user_id=current_user.id)
-    query = db.query(models.Task).filter(models.Task.user_id == current_user.id)
-
-    if year and month:
-        month_start = date(year, month, 1)
-        if month == 12:
-            next_month = date(year + 1, 1, 1)
-        else:
-            next_month = date(year, month + 1, 1)
-        query = query.filter(
-            or_(
-                and_(models.Task.due_date >= month_start, models.Task.due_date < next_month),
-                models.Task.due_date < month_start,
-            )
-        ).filter(models.Task.status != "completed")
-
-    return query.order_by(models.Task.created_at.desc()).all()
+    query = tasks_query(db, current_user.id, year, month)
+    return paginate(query, response, TASK_PAGE_COLUMNS, cursor, limit)
 
 
 @router.post("", response_model=TaskOut)
@@ -52,9 +40,11 @@ def create_task(
     if task_data.get("status") == "completed":
         task_data["is_completed"] = True
     task = models.Task(user_id=current_user.id, **task_data)
+    refresh_next_notify_at(task)
     db.add(task)
     db.commit()
     db.refresh(task)
+    task_scheduler.schedule(task.next_notify_at)
     return task
 
 
@@ -85,8 +75,10 @@ def update_task(
         task.is_completed = True
     else:
         task.is_completed = False
+    refresh_next_notify_at(task)
     db.commit()
     db.refresh(task)
+    task_scheduler.schedule(task.next_notify_at)
     return task
 
 
@@ -7,6 +7,15 @@ class Settings(BaseSettings):
     app_name: str = Field(default="Budget + Task Planner", validation_alias="APP_NAME")
     environment: str = Field(default="development", validation_alias="ENVIRONMENT")
     database_url: str = Field(default="sqlite:///./budget.db", validation_alias="DATABASE_URL")
+    db_pool_size: int | None = Field(default=None, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int | None = Field(default=None, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_pre_ping: bool | None = Field(default=None, validation_alias="DB_POOL_PRE_PING")
+    db_pool_recycle_seconds: int | None = Field(default=None, validation_alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_timeout_seconds: float = Field(default=30, validation_alias="DB_POOL_TIMEOUT_SECONDS")
+    metrics_enabled: bool = Field(default=False, validation_alias="METRICS_ENABLED")
+    metrics_token: str | None = Field(default=None, validation_alias="METRICS_TOKEN")
+    db_async_enabled: bool = Field(default=False, validation_alias="DB_ASYNC_ENABLED")
+    async_database_url: str | None = Field(default=None, validation_alias="ASYNC_DATABASE_URL")
     jwt_secret: str = Field(default="dev-change-me", validation_alias="JWT_SECRET")
     jwt_algorithm: str = Field(default="HS256", validation_alias="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(default=60 * 24, validation_alias="ACCESS_TOKEN_EXPIRE_MINUTES")
@@ -15,6 +24,22 @@ class Settings(BaseSettings):
     cookie_samesite: str = Field(default="lax", validation_alias="COOKIE_SAMESITE")
     admin_username: str = Field(default="admin", validation_alias="ADMIN_USERNAME")
     admin_password: str = Field(default="admin123", validation_alias="ADMIN_PASSWORD")
+    password_hash_workers: int = Field(default=2, validation_alias="PASSWORD_HASH_WORKERS")
+    password_hash_queue_limit: int = Field(default=16, validation_alias="PASSWORD_HASH_QUEUE_LIMIT")
+    principal_cache_enabled: bool = Field(default=True, validation_alias="PRINCIPAL_CACHE_ENABLED")
+    principal_cache_ttl_seconds: float = Field(default=30, validation_alias="PRINCIPAL_CACHE_TTL_SECONDS")
+    principal_cache_max_entries: int = Field(default=4096, validation_alias="PRINCIPAL_CACHE_MAX_ENTRIES")
+    token_revocation_refresh_seconds: float = Field(default=10, validation_alias="TOKEN_REVOCATION_REFRESH_SECONDS")
+    summary_cache_enabled: bool = Field(default=True, validation_alias="SUMMARY_CACHE_ENABLED")
+    summary_cache_max_entries: int = Field(default=2048, validation_alias="SUMMARY_CACHE_MAX_ENTRIES")
+    alert_queue_enabled: bool = Field(default=True, validation_alias="ALERT_QUEUE_ENABLED")
+    alert_queue_delay_seconds: float = Field(default=0.5, validation_alias="ALERT_QUEUE_DELAY_SECONDS")
+    task_scheduler_enabled: bool = Field(default=True, validation_alias="TASK_SCHEDULER_ENABLED")
+    task_scheduler_resync_seconds: float = Field(default=300, validation_alias="TASK_SCHEDULER_RESYNC_SECONDS")
+    page_size_default: int = Field(default=50, validation_alias="PAGE_SIZE_DEFAULT")
+    page_size_max: int = Field(default=500, validation_alias="PAGE_SIZE_MAX")
+    debt_sweep_workers: int = Field(default=0, validation_alias="DEBT_SWEEP_WORKERS")
+    debt_monte_carlo_cpu_seconds: float = Field(default=5.0, validation_alias="DEBT_MONTE_CARLO_CPU_SECONDS")
 
     model_config = SettingsConfigDict(env_file=".env", env_ignore_empty=True)
 
@@ -1,5 +1,9 @@
-﻿from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+﻿import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -7,21 +11,113 @@ from passlib.context import CryptContext
 from app.core.config import get_settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class PasswordHashingBusy(RuntimeError):
+    pass
+
+
+class PasswordHasher:
+    # bcrypt releases the GIL, so a small thread pool runs hashes in parallel
+    # while capping how many request threads can be parked behind it.
+    def __init__(self, workers: int, queue_limit: int) -> None:
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {
+            "completed": 0,
+            "rejected": 0,
+            "queue_wait_seconds_total": 0.0,
+            "queue_wait_seconds_max": 0.0,
+            "hash_seconds_total": 0.0,
+            "hash_seconds_max": 0.0,
+        }
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._in_flight >= self.workers + self.queue_limit:
+                self._stats["rejected"] += 1
+                raise PasswordHashingBusy("Too many password operations in progress")
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+            executor = self._executor
+        try:
+            return executor.submit(self._timed, fn, time.perf_counter(), *args).result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _timed(self, fn: Callable[..., Any], submitted: float, *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            waited = started - submitted
+            with self._lock:
+                self._stats["completed"] += 1
+                self._stats["queue_wait_seconds_total"] += waited
+                self._stats["queue_wait_seconds_max"] = max(self._stats["queue_wait_seconds_max"], waited)
+                self._stats["hash_seconds_total"] += elapsed
+                self._stats["hash_seconds_max"] = max(self._stats["hash_seconds_max"], elapsed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            completed = self._stats["completed"]
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self._in_flight,
+                **self._stats,
+                "queue_wait_seconds_avg": self._stats["queue_wait_seconds_total"] / completed if completed else 0.0,
+                "hash_seconds_avg": self._stats["hash_seconds_total"] / completed if completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    workers=get_settings().password_hash_workers,
+    queue_limit=get_settings().password_hash_queue_limit,
+)
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.run(pwd_context.hash, password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.run(pwd_context.verify, plain_password, hashed_password)
 
 
-def create_access_token(subject: str, expires_minutes: int | None = None) -> str:
+def create_access_token(
+    subject: str, expires_minutes: int | None = None, user_id: int | None = None
+) -> str:
     settings = get_settings()
     expire_minutes = expires_minutes or settings.access_token_expire_minutes
-    expire = datetime.now(timezone.utc) + timedelta(minutes=expire_minutes)
-    to_encode: Dict[str, Any] = {"sub": subject, "exp": expire}
+    issued_at = datetime.now(timezone.utc)
+    expire = issued_at + timedelta(minutes=expire_minutes)
+    to_encode: Dict[str, Any] = {
+        "sub": subject,
+        "exp": expire,
+        "iat": issued_at,
+        # Sub-second issue time, so a revocation cutoff in the same second as
+        # a login can still tell the two apart.
+        "iat_us": (issued_at - EPOCH) // timedelta(microseconds=1),
+        "jti": uuid.uuid4().hex,
+    }
+    if user_id is not None:
+        to_encode["uid"] = user_id
     return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
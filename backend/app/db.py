@@ -1,5 +1,10 @@
-﻿from sqlalchemy import create_engine
+﻿import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import get_settings
 
@@ -8,11 +13,104 @@ class Base(DeclarativeBase):
     pass
 
 
+class _TimedCheckoutMixin:
+    # Records how long callers wait for a pooled connection.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.wait_stats = {
+            "checkouts_total": 0,
+            "timeouts_total": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            with self._wait_lock:
+                self.wait_stats["timeouts_total"] += 1
+            raise
+        waited = time.perf_counter() - started
+        with self._wait_lock:
+            self.wait_stats["checkouts_total"] += 1
+            self.wait_stats["wait_seconds_total"] += waited
+            self.wait_stats["wait_seconds_max"] = max(self.wait_stats["wait_seconds_max"], waited)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class StatementGauge:
+    # Counts statements executing at once on an engine. The sync stack cannot
+    # run more than its threadpool allows; the async stack is not capped.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stats = {"statements_in_flight": 0, "statements_in_flight_max": 0}
+
+    def attach(self, sync_engine) -> None:
+        event.listen(sync_engine, "before_cursor_execute", self._started)
+        event.listen(sync_engine, "after_cursor_execute", self._finished)
+        event.listen(sync_engine, "handle_error", self._failed)
+
+    def _started(self, *args) -> None:
+        with self._lock:
+            self.stats["statements_in_flight"] += 1
+            self.stats["statements_in_flight_max"] = max(
+                self.stats["statements_in_flight_max"], self.stats["statements_in_flight"]
+            )
+
+    def _finished(self, *args) -> None:
+        with self._lock:
+            self.stats["statements_in_flight"] -= 1
+
+    def _failed(self, context) -> None:
+        if context.cursor is not None:
+            self._finished()
+
+
+def _pool_options(url: str, poolclass) -> dict:
+    if url.startswith("sqlite") and ":memory:" in url:
+        return {}
+    postgres = url.startswith(("postgresql", "postgres"))
+    # Postgres gets production defaults; SQLite keeps SQLAlchemy's own.
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.db_pool_size if settings.db_pool_size is not None else (10 if postgres else 5),
+        "max_overflow": (
+            settings.db_max_overflow if settings.db_max_overflow is not None else (20 if postgres else 10)
+        ),
+        "pool_pre_ping": settings.db_pool_pre_ping if settings.db_pool_pre_ping is not None else postgres,
+        "pool_recycle": (
+            settings.db_pool_recycle_seconds
+            if settings.db_pool_recycle_seconds is not None
+            else (1800 if postgres else -1)
+        ),
+        "pool_timeout": settings.db_pool_timeout_seconds,
+    }
+
+
 settings = get_settings()
 engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False} if settings.database_url.startswith("sqlite") else {},
+    **_pool_options(settings.database_url, TimedQueuePool),
 )
+statement_gauge = StatementGauge()
+statement_gauge.attach(engine)
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
@@ -24,3 +122,32 @@ def get_db():
     finally:
         db.close()
 
+
+def to_async_url(url: str) -> str:
+    if settings.async_database_url:
+        return settings.async_database_url
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    if url.startswith(("postgresql:", "postgresql+psycopg2:", "postgres:")):
+        return "postgresql+asyncpg:" + url.split(":", 1)[1]
+    raise ValueError(f"No async driver configured for {url.split(':', 1)[0]}; set ASYNC_DATABASE_URL")
+
+
+# The async stack is opt-in, so its drivers are only needed when it is enabled.
+async_engine = None
+async_statement_gauge = None
+AsyncSessionLocal = None
+if settings.db_async_enabled:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_url = to_async_url(settings.database_url)
+    async_engine = create_async_engine(async_url, **_pool_options(async_url, TimedAsyncQueuePool))
+    async_statement_gauge = StatementGauge()
+    async_statement_gauge.attach(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
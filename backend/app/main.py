@@ -1,36 +1,23 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.api import auth, budget, categories, debts, expenses, alerts, tasks, suggestions, admin
+from app.api import auth, budget, categories, debts, expenses, alerts, tasks, suggestions, admin, async_reads, metrics
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.core.config import get_settings
-from app.core.security import hash_password
-from app.db import SessionLocal
+from app.core.security import PasswordHashingBusy, hash_password, password_hasher
+from app.db import SessionLocal, async_engine
+from app.services.alert_queue import alert_queue
+from app.services.debt_compare import shutdown_sweep_pool
+from app.services.task_scheduler import task_scheduler
+from app.services.token_revocation import revocation_store
 from app import models
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[settings.frontend_origin],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(auth.router)
-app.include_router(categories.router)
-app.include_router(budget.router)
-app.include_router(expenses.router)
-app.include_router(debts.router)
-app.include_router(alerts.router)
-app.include_router(tasks.router)
-app.include_router(suggestions.router)
-app.include_router(admin.router)
-
 
-@app.on_event("startup")
 def ensure_admin_user():
     db = SessionLocal()
     try:
@@ -50,6 +37,90 @@ def ensure_admin_user():
         db.close()
 
 
+def start_alert_queue():
+    if settings.alert_queue_enabled:
+        alert_queue.start()
+
+
+def drain_alert_queue():
+    alert_queue.stop(timeout=10)
+
+
+def stop_sweep_pool():
+    shutdown_sweep_pool()
+
+
+def start_revocation_refresh():
+    revocation_store.refresh()
+    revocation_store.start()
+
+
+def stop_revocation_refresh():
+    revocation_store.stop(timeout=10)
+
+
+def start_task_scheduler():
+    if settings.task_scheduler_enabled:
+        task_scheduler.start()
+
+
+def stop_task_scheduler():
+    task_scheduler.stop(timeout=10)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    ensure_admin_user()
+    start_revocation_refresh()
+    start_alert_queue()
+    start_task_scheduler()
+    yield
+    stop_task_scheduler()
+    stop_revocation_refresh()
+    drain_alert_queue()
+    stop_sweep_pool()
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[settings.frontend_origin],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
+)
+
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy(request: Request, exc: PasswordHashingBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+if settings.db_async_enabled:
+    # Registered first so these async routes win over their sync twins.
+    app.include_router(async_reads.router)
+app.include_router(auth.router)
+app.include_router(categories.router)
+app.include_router(budget.router)
+app.include_router(expenses.router)
+app.include_router(debts.router)
+app.include_router(alerts.router)
+app.include_router(tasks.router)
+app.include_router(suggestions.router)
+app.include_router(admin.router)
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
+
+
 @app.get("/")
 def root():
     return {"status": "ok", "service": settings.app_name}
@@ -1,6 +1,6 @@
 from datetime import datetime, date, time
 
-from sqlalchemy import Boolean, Date, DateTime, Float, ForeignKey, Integer, String, Text, Time
+from sqlalchemy import Boolean, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, Time, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
@@ -8,6 +8,9 @@ from app.db import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
@@ -33,6 +36,9 @@ class User(Base):
 
 class BudgetMonth(Base):
     __tablename__ = "budget_months"
+    __table_args__ = (
+        Index("ix_budget_months_user_period", "user_id", "year", "month"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -50,6 +56,9 @@ class BudgetMonth(Base):
 
 class Category(Base):
     __tablename__ = "categories"
+    __table_args__ = (
+        Index("ix_categories_user_active", "user_id", "is_active"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -67,6 +76,9 @@ class Category(Base):
 
 class CategoryLimit(Base):
     __tablename__ = "category_limits"
+    __table_args__ = (
+        Index("ix_category_limits_user_category_period", "user_id", "category_id", "year", "month"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -79,6 +91,9 @@ class CategoryLimit(Base):
 
 class BudgetIncomeSource(Base):
     __tablename__ = "budget_income_sources"
+    __table_args__ = (
+        Index("ix_budget_income_sources_budget_month", "budget_month_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     budget_month_id: Mapped[int] = mapped_column(ForeignKey("budget_months.id"))
@@ -91,6 +106,9 @@ class BudgetIncomeSource(Base):
 
 class Debt(Base):
     __tablename__ = "debts"
+    __table_args__ = (
+        Index("ix_debts_user_active", "user_id", "is_active"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -107,6 +125,10 @@ class Debt(Base):
 
 class Expense(Base):
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_user_date", "user_id", "date"),
+        Index("ix_expenses_user_category", "user_id", "category_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -120,8 +142,45 @@ class Expense(Base):
     category = relationship("Category", back_populates="expenses")
 
 
+class ExpenseMonthRollup(Base):
+    __tablename__ = "expense_month_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "year",
+            "month",
+            "category_id",
+            name="uq_expense_month_rollups_user_period_category",
+        ),
+        # NULLs never conflict in the constraint above, so uncategorized
+        # spend gets its own partial unique index to upsert against.
+        Index(
+            "uq_expense_month_rollups_user_period_uncategorized",
+            "user_id",
+            "year",
+            "month",
+            unique=True,
+            sqlite_where=text("category_id IS NULL"),
+            postgresql_where=text("category_id IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    year: Mapped[int] = mapped_column(Integer)
+    month: Mapped[int] = mapped_column(Integer)
+    category_id: Mapped[int | None] = mapped_column(ForeignKey("categories.id"), nullable=True)
+    total: Mapped[float] = mapped_column(Float, default=0)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class Alert(Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        Index("uq_alerts_user_code_period", "user_id", "code", "year", "month", unique=True),
+        Index("ix_alerts_user_period_created_at", "user_id", "year", "month", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -139,6 +198,11 @@ class Alert(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_user_due_date", "user_id", "due_date"),
+        Index("ix_tasks_user_created_at", "user_id", "created_at", "id"),
+        Index("ix_tasks_next_notify_at", "next_notify_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -154,6 +218,7 @@ class Task(Base):
     alert_email: Mapped[str | None] = mapped_column(String(200), nullable=True)
     alert_phone: Mapped[str | None] = mapped_column(String(40), nullable=True)
     last_alerted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    next_notify_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="tasks")
@@ -161,6 +226,9 @@ class Task(Base):
 
 class Suggestion(Base):
     __tablename__ = "suggestions"
+    __table_args__ = (
+        Index("ix_suggestions_created_at", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -173,6 +241,9 @@ class Suggestion(Base):
 
 class PasswordResetRequest(Base):
     __tablename__ = "password_reset_requests"
+    __table_args__ = (
+        Index("ix_password_reset_requests_created_at", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
@@ -181,3 +252,19 @@ class PasswordResetRequest(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="password_resets")
+
+
+class RevokedToken(Base):
+    # A row revokes one token by jti, or every token of user_id issued
+    # before issued_before. No foreign key: revocations outlive deleted users.
+    __tablename__ = "revoked_tokens"
+    __table_args__ = (
+        Index("ix_revoked_tokens_expires_at", "expires_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    jti: Mapped[str | None] = mapped_column(String(64), nullable=True, unique=True)
+    user_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    issued_before: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -1,5 +1,5 @@
 from datetime import date, datetime, time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 from pydantic import ConfigDict
@@ -123,6 +123,16 @@ class ExpenseOut(BaseModel):
     created_at: datetime
 
 
+class ExpenseImportError(BaseModel):
+    row: int
+    error: str
+
+
+class ExpenseBulkResult(BaseModel):
+    inserted: int
+    errors: List[ExpenseImportError]
+
+
 class AlertOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -201,14 +211,74 @@ class BudgetSummary(BaseModel):
     categories: List[CategorySpend]
 
 
+class BudgetTrendMonth(BudgetSummary):
+    year: int
+    month: int
+
+
 class DebtSimulationResult(BaseModel):
     total_months: int
     payoff_schedule: List[dict]
+    total_interest: float = 0
+    non_amortizing_debt_ids: List[int] = []
 
 
 class DebtSimulationRequest(BaseModel):
     strategy: str = Field(default="avalanche")
     extra_monthly_payment: float = 0
+    engine: str = Field(default="loop")
+    custom_order: List[int] = []
+
+
+class DebtCompareRequest(BaseModel):
+    extra_monthly_payment: float = 0
+    custom_order: List[int] = []
+    engine: str = Field(default="loop")
+
+
+class DebtStrategyResult(DebtSimulationResult):
+    strategy: str
+
+
+class DebtCompareResult(BaseModel):
+    strategies: List[DebtStrategyResult]
+
+
+class DebtSweepRequest(BaseModel):
+    extra_start: float = 0
+    extra_stop: float = 1000
+    extra_step: float = 50
+    strategies: List[str] = ["avalanche", "snowball"]
+    engine: str = Field(default="event")
+
+
+class DebtSweepCurve(BaseModel):
+    strategy: str
+    total_months: List[int]
+    total_interest: List[float]
+
+
+class DebtSweepResult(BaseModel):
+    extra_monthly_payment: List[float]
+    curves: List[DebtSweepCurve]
+
+
+class DebtMonteCarloRequest(BaseModel):
+    strategy: str = Field(default="avalanche")
+    extra_monthly_payment: float = 0
+    custom_order: List[int] = []
+    trials: int = Field(default=2000, ge=1, le=20000)
+    apr_volatility: float = Field(default=0.25, ge=0)
+    extra_volatility: float = Field(default=0.2, ge=0)
+    seed: Optional[int] = Field(default=None, ge=0)
+
+
+class DebtMonteCarloResult(BaseModel):
+    trials: int
+    seed: int
+    total_months: Dict[str, float]
+    total_interest: Dict[str, float]
+    payoff_schedule: List[dict]
 
 
 class AuthLogin(BaseModel):
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db import SessionLocal
+from app.services.alerts import maybe_create_alerts, maybe_create_category_alerts
+
+logger = logging.getLogger(__name__)
+
+
+class AlertQueue:
+    def __init__(self, delay_seconds: float = 0.5) -> None:
+        self.delay_seconds = delay_seconds
+        # Per month: summed spend deltas by category while every coalesced
+        # write was an expense, or None once any write needs a full pass.
+        self._pending: dict[tuple[int, int, int], dict[int | None, float] | None] = {}
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="alert-queue", daemon=True)
+            self._thread.start()
+
+    def mark_dirty(
+        self,
+        user_id: int,
+        year: int,
+        month: int,
+        category_id: int | None = None,
+        delta: float | None = None,
+    ) -> None:
+        key = (user_id, year, month)
+        with self._condition:
+            if delta is None:
+                self._pending[key] = None
+            elif key not in self._pending:
+                self._pending[key] = {category_id: delta}
+            else:
+                deltas = self._pending[key]
+                if deltas is not None:
+                    deltas[category_id] = deltas.get(category_id, 0.0) + delta
+            self._condition.notify_all()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._in_flight:
+                if self._thread is None or not self._thread.is_alive():
+                    self._evaluate_locked()
+                    continue
+                self._condition.notify_all()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self, timeout: float | None = None) -> bool:
+        drained = self.drain(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+        return drained
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if self._stopping and not self._pending:
+                    return
+            # Let a burst of writes for the same month settle into a single evaluation.
+            time.sleep(self.delay_seconds)
+            with self._condition:
+                self._evaluate_locked()
+
+    def _evaluate_locked(self) -> None:
+        batch = self._pending
+        self._pending = {}
+        self._in_flight += len(batch)
+        self._condition.release()
+        try:
+            for (user_id, year, month), deltas in batch.items():
+                db = SessionLocal()
+                try:
+                    if deltas is None:
+                        maybe_create_alerts(db, user_id, year, month)
+                    else:
+                        for category_id, delta in deltas.items():
+                            maybe_create_category_alerts(db, user_id, year, month, category_id, delta)
+                except Exception:
+                    logger.exception("Alert evaluation failed for user %s %s-%s", user_id, year, month)
+                    db.rollback()
+                finally:
+                    db.close()
+        finally:
+            self._condition.acquire()
+            self._in_flight -= len(batch)
+            self._condition.notify_all()
+
+
+alert_queue = AlertQueue(delay_seconds=get_settings().alert_queue_delay_seconds)
+
+
+def schedule_alerts(
+    db: Session,
+    user_id: int,
+    year: int,
+    month: int,
+    category_id: int | None = None,
+    delta: float | None = None,
+) -> None:
+    if get_settings().alert_queue_enabled:
+        alert_queue.mark_dirty(user_id, year, month, category_id, delta)
+    elif delta is not None:
+        maybe_create_category_alerts(db, user_id, year, month, category_id, delta)
+    else:
+        maybe_create_alerts(db, user_id, year, month)
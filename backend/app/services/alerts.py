@@ -1,29 +1,51 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import datetime
 
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app import models
-from app.services.budget import compute_budget_summary
+from app.services.budget import (
+    get_income_sources_total,
+    get_month_total_spent,
+    get_planned_savings,
+    get_salary_for_month,
+    project_month_total,
+)
+from app.services.category_limits import get_monthly_limits
+from app.services.summary_cache import get_budget_summary
 
 
-def _alert_exists(db: Session, user_id: int, code: str, year: int, month: int) -> bool:
-    return (
-        db.query(models.Alert)
-        .filter(
-            models.Alert.user_id == user_id,
-            models.Alert.code == code,
-            models.Alert.year == year,
-            models.Alert.month == month,
-        )
-        .first()
-        is not None
-    )
+def insert_alerts(db: Session, rows: list[dict]) -> None:
+    if not rows:
+        return
+
+    now = datetime.utcnow()
+    values = [{"is_read": False, "created_at": now, "category_id": None, **row} for row in rows]
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        db.execute(postgresql_insert(models.Alert).values(values).on_conflict_do_nothing())
+    elif dialect == "sqlite":
+        db.execute(sqlite_insert(models.Alert).values(values).on_conflict_do_nothing())
+    else:
+        for value in values:
+            exists = (
+                db.query(models.Alert.id)
+                .filter(
+                    models.Alert.user_id == value["user_id"],
+                    models.Alert.code == value["code"],
+                    models.Alert.year == value["year"],
+                    models.Alert.month == value["month"],
+                )
+                .first()
+            )
+            if not exists:
+                db.add(models.Alert(**value))
 
 
-def _create_alert(
-    db: Session,
+def _alert(
     user_id: int,
     code: str,
     level: str,
@@ -31,66 +53,157 @@ def _create_alert(
     year: int,
     month: int,
     category_id: int | None = None,
-) -> None:
-    if _alert_exists(db, user_id, code, year, month):
-        return
-
-    alert = models.Alert(
-        user_id=user_id,
-        category_id=category_id,
-        year=year,
-        month=month,
-        code=code,
-        level=level,
-        message=message,
-    )
-    db.add(alert)
+) -> dict:
+    return {
+        "user_id": user_id,
+        "category_id": category_id,
+        "year": year,
+        "month": month,
+        "code": code,
+        "level": level,
+        "message": message,
+    }
 
 
-def maybe_create_alerts(db: Session, user_id: int, year: int, month: int) -> None:
-    summary = compute_budget_summary(db, user_id, year, month)
-    for cat in summary["categories"]:
-        limit_amount = cat["monthly_limit"]
-        if limit_amount <= 0:
-            continue
-        spent = cat["spent"]
-        if spent >= limit_amount:
-            _create_alert(
-                db,
+def _check_category(
+    pending: list[dict],
+    user_id: int,
+    year: int,
+    month: int,
+    category_id: int,
+    name: str,
+    limit_amount: float,
+    spent: float,
+) -> None:
+    if limit_amount <= 0:
+        return
+    if spent >= limit_amount:
+        pending.append(
+            _alert(
                 user_id,
-                f"cat-{cat['category_id']}-100-{year}-{month}",
+                f"cat-{category_id}-100-{year}-{month}",
                 "alert",
-                f"{cat['name']} is over the monthly limit.",
+                f"{name} is over the monthly limit.",
                 year,
                 month,
-                category_id=cat["category_id"],
+                category_id=category_id,
             )
-        elif spent >= 0.8 * limit_amount:
-            _create_alert(
-                db,
+        )
+    elif spent >= 0.8 * limit_amount:
+        pending.append(
+            _alert(
                 user_id,
-                f"cat-{cat['category_id']}-80-{year}-{month}",
+                f"cat-{category_id}-80-{year}-{month}",
                 "warning",
-                f"{cat['name']} reached 80% of the monthly limit.",
+                f"{name} reached 80% of the monthly limit.",
                 year,
                 month,
-                category_id=cat["category_id"],
+                category_id=category_id,
             )
+        )
 
-    projected_total = summary["projected_total"]
-    total_income = summary["total_income"]
-    planned_savings = summary["planned_savings"]
+
+def _check_pace(
+    pending: list[dict],
+    user_id: int,
+    year: int,
+    month: int,
+    projected_total: float,
+    total_income: float,
+    planned_savings: float,
+) -> None:
     threshold = total_income - planned_savings if planned_savings else total_income
     if threshold > 0 and projected_total > threshold:
-        _create_alert(
-            db,
+        pending.append(
+            _alert(
+                user_id,
+                f"pace-{year}-{month}",
+                "alert",
+                "Overall spending pace is projected to exceed the budget.",
+                year,
+                month,
+            )
+        )
+
+
+def maybe_create_alerts(db: Session, user_id: int, year: int, month: int) -> None:
+    summary = get_budget_summary(db, user_id, year, month)
+    pending: list[dict] = []
+    for cat in summary["categories"]:
+        _check_category(
+            pending,
             user_id,
-            f"pace-{year}-{month}",
-            "alert",
-            "Overall spending pace is projected to exceed the budget.",
             year,
             month,
+            cat["category_id"],
+            cat["name"],
+            cat["monthly_limit"],
+            cat["spent"],
         )
 
+    _check_pace(
+        pending,
+        user_id,
+        year,
+        month,
+        summary["projected_total"],
+        summary["total_income"],
+        summary["planned_savings"],
+    )
+
+    insert_alerts(db, pending)
     db.commit()
 
+
+def maybe_create_category_alerts(
+    db: Session, user_id: int, year: int, month: int, category_id: int | None, delta: float
+) -> None:
+    # Removing spend can never cross a threshold, so only growth is evaluated.
+    if delta <= 0:
+        return
+
+    pending: list[dict] = []
+    category = None
+    if category_id:
+        category = (
+            db.query(models.Category)
+            .filter(
+                models.Category.user_id == user_id,
+                models.Category.id == category_id,
+                models.Category.is_active.is_(True),
+                models.Category.tag != "uncategorized",
+            )
+            .first()
+        )
+    if category:
+        limit_map = get_monthly_limits(db, user_id, year, month, [category.id])
+        limit_amount = float(limit_map.get(category.id, category.monthly_limit or 0))
+        spent = (
+            db.query(models.ExpenseMonthRollup.total)
+            .filter(
+                models.ExpenseMonthRollup.user_id == user_id,
+                models.ExpenseMonthRollup.year == year,
+                models.ExpenseMonthRollup.month == month,
+                models.ExpenseMonthRollup.category_id == category.id,
+            )
+            .scalar()
+        )
+        _check_category(
+            pending, user_id, year, month, category.id, category.name, limit_amount, float(spent or 0)
+        )
+
+    salary, other_income = get_salary_for_month(db, user_id, year, month)
+    total_income = salary + other_income + get_income_sources_total(db, user_id, year, month)
+    projected_total = project_month_total(get_month_total_spent(db, user_id, year, month), year, month)
+    _check_pace(
+        pending,
+        user_id,
+        year,
+        month,
+        projected_total,
+        total_income,
+        get_planned_savings(db, user_id, year, month),
+    )
+
+    insert_alerts(db, pending)
+    db.commit()
@@ -92,25 +92,64 @@ def get_income_sources_total(db: Session, user_id: int, year: int, month: int) -
 
 
 def get_spent_by_category(db: Session, user_id: int, year: int, month: int) -> Dict[int, float]:
-    start = date(year, month, 1)
-    last_day = monthrange(year, month)[1]
-    end = date(year, month, last_day)
-
     rows = (
-        db.query(models.Expense.category_id, func.sum(models.Expense.amount))
+        db.query(models.ExpenseMonthRollup.category_id, models.ExpenseMonthRollup.total)
         .filter(
-            models.Expense.user_id == user_id,
-            models.Expense.date >= start,
-            models.Expense.date <= end,
+            models.ExpenseMonthRollup.user_id == user_id,
+            models.ExpenseMonthRollup.year == year,
+            models.ExpenseMonthRollup.month == month,
         )
-        .group_by(models.Expense.category_id)
         .all()
     )
-    return {row[0] or 0: float(row[1] or 0) for row in rows}
+    spent: Dict[int, float] = {}
+    for category_id, total in rows:
+        key = category_id or 0
+        spent[key] = spent.get(key, 0.0) + float(total or 0)
+    return spent
 
 
-def compute_budget_summary(db: Session, user_id: int, year: int, month: int):
+def get_month_total_spent(db: Session, user_id: int, year: int, month: int) -> float:
+    total = (
+        db.query(func.sum(models.ExpenseMonthRollup.total))
+        .filter(
+            models.ExpenseMonthRollup.user_id == user_id,
+            models.ExpenseMonthRollup.year == year,
+            models.ExpenseMonthRollup.month == month,
+        )
+        .scalar()
+    )
+    return float(total or 0)
+
+
+def get_planned_savings(db: Session, user_id: int, year: int, month: int) -> float:
     categories = (
+        db.query(models.Category.id, models.Category.monthly_limit)
+        .filter(
+            models.Category.user_id == user_id,
+            models.Category.is_active.is_(True),
+            models.Category.tag == "savings",
+        )
+        .all()
+    )
+    if not categories:
+        return 0.0
+    limit_map = get_monthly_limits(db, user_id, year, month, [c.id for c in categories])
+    return sum(float(limit_map.get(c.id, c.monthly_limit or 0)) for c in categories)
+
+
+def project_month_total(total_spent: float, year: int, month: int) -> float:
+    today = date.today()
+    days_in_month = monthrange(year, month)[1]
+    if today.year == year and today.month == month:
+        day_of_month = max(1, today.day)
+    else:
+        day_of_month = days_in_month
+
+    return (total_spent / day_of_month) * days_in_month if day_of_month else 0
+
+
+def _get_summary_categories(db: Session, user_id: int) -> list[models.Category]:
+    return (
         db.query(models.Category)
         .filter(
             models.Category.user_id == user_id,
@@ -119,11 +158,30 @@ def compute_budget_summary(db: Session, user_id: int, year: int, month: int):
         )
         .all()
     )
+
+
+def compute_budget_summary(db: Session, user_id: int, year: int, month: int):
+    categories = _get_summary_categories(db, user_id)
     salary, other_income = get_salary_for_month(db, user_id, year, month)
     income_sources_total = get_income_sources_total(db, user_id, year, month)
-    total_income = salary + other_income + income_sources_total
     spent_map = get_spent_by_category(db, user_id, year, month)
     limit_map = get_monthly_limits(db, user_id, year, month, [c.id for c in categories])
+    return _build_summary(
+        year, month, categories, salary, other_income, income_sources_total, spent_map, limit_map
+    )
+
+
+def _build_summary(
+    year: int,
+    month: int,
+    categories: list[models.Category],
+    salary: float,
+    other_income: float,
+    income_sources_total: float,
+    spent_map: Dict[int, float],
+    limit_map: Dict[int, float],
+):
+    total_income = salary + other_income + income_sources_total
 
     planned_savings = 0.0
     planned_debt_payment = 0.0
@@ -164,14 +222,7 @@ def compute_budget_summary(db: Session, user_id: int, year: int, month: int):
     remaining_flex = total_income - total_limits
     total_spent = sum(spent_map.values())
 
-    today = date.today()
-    days_in_month = monthrange(year, month)[1]
-    if today.year == year and today.month == month:
-        day_of_month = max(1, today.day)
-    else:
-        day_of_month = days_in_month
-
-    projected_total = (total_spent / day_of_month) * days_in_month if day_of_month else 0
+    projected_total = project_month_total(total_spent, year, month)
 
     suggestions: List[str] = []
     if remaining_flex < 0:
@@ -211,6 +262,121 @@ def compute_budget_summary(db: Session, user_id: int, year: int, month: int):
     }
 
 
+def iter_months(start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
+    months = []
+    year, month = start
+    while (year, month) <= end:
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def compute_budget_trend(
+    db: Session, user_id: int, start: Tuple[int, int], end: Tuple[int, int]
+) -> List[dict]:
+    months = iter_months(start, end)
+    if not months:
+        return []
+    first = start[0] * 12 + start[1]
+    last = end[0] * 12 + end[1]
+
+    categories = _get_summary_categories(db, user_id)
+
+    income_rows = (
+        db.query(
+            models.BudgetMonth.year,
+            models.BudgetMonth.month,
+            models.BudgetMonth.salary,
+            models.BudgetMonth.other_income,
+            func.coalesce(func.sum(models.BudgetIncomeSource.amount), 0),
+        )
+        .outerjoin(
+            models.BudgetIncomeSource,
+            models.BudgetIncomeSource.budget_month_id == models.BudgetMonth.id,
+        )
+        .filter(
+            models.BudgetMonth.user_id == user_id,
+            (models.BudgetMonth.year * 12 + models.BudgetMonth.month).between(first, last),
+        )
+        .group_by(models.BudgetMonth.id)
+        .all()
+    )
+    income_map: Dict[Tuple[int, int], Tuple[float, float, float]] = {}
+    for year, month, salary, other_income, sources_total in income_rows:
+        # Matches get_salary_for_month, which reads the first row for a month.
+        income_map.setdefault(
+            (year, month), (float(salary or 0), float(other_income or 0), float(sources_total or 0))
+        )
+
+    spend_rows = (
+        db.query(
+            models.ExpenseMonthRollup.year,
+            models.ExpenseMonthRollup.month,
+            models.ExpenseMonthRollup.category_id,
+            models.ExpenseMonthRollup.total,
+        )
+        .filter(
+            models.ExpenseMonthRollup.user_id == user_id,
+            (models.ExpenseMonthRollup.year * 12 + models.ExpenseMonthRollup.month).between(
+                first, last
+            ),
+        )
+        .all()
+    )
+    spent_maps: Dict[Tuple[int, int], Dict[int, float]] = {}
+    for year, month, category_id, total in spend_rows:
+        spent = spent_maps.setdefault((year, month), {})
+        key = category_id or 0
+        spent[key] = spent.get(key, 0.0) + float(total or 0)
+
+    limit_history: Dict[int, List[Tuple[int, float]]] = {}
+    if categories:
+        limit_rows = (
+            db.query(
+                models.CategoryLimit.category_id,
+                models.CategoryLimit.year,
+                models.CategoryLimit.month,
+                models.CategoryLimit.monthly_limit,
+            )
+            .filter(
+                models.CategoryLimit.user_id == user_id,
+                models.CategoryLimit.category_id.in_([c.id for c in categories]),
+                (models.CategoryLimit.year * 12 + models.CategoryLimit.month) <= last,
+            )
+            .order_by(models.CategoryLimit.year, models.CategoryLimit.month)
+            .all()
+        )
+        for category_id, year, month, monthly_limit in limit_rows:
+            limit_history.setdefault(category_id, []).append(
+                (year * 12 + month, float(monthly_limit or 0))
+            )
+
+    trend = []
+    for year, month in months:
+        period = year * 12 + month
+        limit_map: Dict[int, float] = {}
+        for category_id, history in limit_history.items():
+            for limit_period, monthly_limit in history:
+                if limit_period > period:
+                    break
+                limit_map[category_id] = monthly_limit
+        salary, other_income, sources_total = income_map.get((year, month), (0.0, 0.0, 0.0))
+        summary = _build_summary(
+            year,
+            month,
+            categories,
+            salary,
+            other_income,
+            sources_total,
+            spent_maps.get((year, month), {}),
+            limit_map,
+        )
+        summary["year"] = year
+        summary["month"] = month
+        trend.append(summary)
+    return trend
+
+
 def ensure_uncategorized(db: Session, user_id: int) -> models.Category:
     uncategorized = (
         db.query(models.Category)
@@ -1,6 +1,6 @@
 from typing import Dict
 
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, desc, func
 from sqlalchemy.orm import Session
 
 from app import models
@@ -36,22 +36,29 @@ def upsert_category_limit(
 def get_monthly_limits(
     db: Session, user_id: int, year: int, month: int, category_ids: list[int]
 ) -> Dict[int, float]:
-    limits: Dict[int, float] = {}
-    for category_id in category_ids:
-        record = (
-            db.query(models.CategoryLimit)
-            .filter(
-                models.CategoryLimit.user_id == user_id,
-                models.CategoryLimit.category_id == category_id,
-                and_(
-                    (models.CategoryLimit.year < year)
-                    | ((models.CategoryLimit.year == year) & (models.CategoryLimit.month <= month))
-                ),
+    if not category_ids:
+        return {}
+
+    ranked = (
+        db.query(
+            models.CategoryLimit.category_id.label("category_id"),
+            models.CategoryLimit.monthly_limit.label("monthly_limit"),
+            func.row_number()
+            .over(
+                partition_by=models.CategoryLimit.category_id,
+                order_by=(desc(models.CategoryLimit.year), desc(models.CategoryLimit.month)),
             )
-            .order_by(desc(models.CategoryLimit.year), desc(models.CategoryLimit.month))
-            .first()
+            .label("rank"),
         )
-        if record:
-            limits[category_id] = float(record.monthly_limit or 0)
-
-    return limits
+        .filter(
+            models.CategoryLimit.user_id == user_id,
+            models.CategoryLimit.category_id.in_(category_ids),
+            and_(
+                (models.CategoryLimit.year < year)
+                | ((models.CategoryLimit.year == year) & (models.CategoryLimit.month <= month))
+            ),
+        )
+        .subquery()
+    )
+    rows = db.query(ranked.c.category_id, ranked.c.monthly_limit).filter(ranked.c.rank == 1).all()
+    return {row.category_id: float(row.monthly_limit or 0) for row in rows}
@@ -1,7 +1,8 @@
 ﻿from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Iterator, List, Tuple
 
 
 @dataclass
@@ -18,44 +19,140 @@ class DebtSimulationError(ValueError):
     pass
 
 
-def simulate_payoff(debts: List[DebtItem], strategy: str, extra_monthly_payment: float):
+MAX_MONTHS = 1200
+ENGINES = {"loop", "numpy", "event"}
+STRATEGIES = {"avalanche", "snowball", "custom"}
+
+
+def _custom_rank(debts: List[DebtItem], order: List[int] | None) -> Dict[int, int]:
+    rank = {debt_id: position for position, debt_id in enumerate(order or [])}
+    for position, d in enumerate(debts):
+        rank.setdefault(d.id, len(rank) + position)
+    return rank
+
+
+def _order_key(strategy: str, rank: Dict[int, int] | None):
+    if strategy == "avalanche":
+        return lambda d: (-d.apr, d.balance)
+    if strategy == "snowball":
+        return lambda d: (d.balance, -d.apr)
+    return lambda d: rank[d.id]
+
+
+def simulate_payoff(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    engine: str = "loop",
+    order: List[int] | None = None,
+):
     if not debts:
-        return {"total_months": 0, "payoff_schedule": []}
+        return {"total_months": 0, "payoff_schedule": [], "total_interest": 0.0, "non_amortizing_debt_ids": []}
 
     strategy = strategy.lower().strip()
-    if strategy not in {"avalanche", "snowball"}:
-        raise DebtSimulationError("Strategy must be avalanche or snowball.")
+    if strategy not in STRATEGIES:
+        raise DebtSimulationError("Strategy must be avalanche, snowball or custom.")
+
+    engine = engine.lower().strip()
+    if engine not in ENGINES:
+        raise DebtSimulationError(f"Engine must be one of: {', '.join(sorted(ENGINES))}.")
 
     debts = [d for d in debts if d.balance > 0]
     if not debts:
-        return {"total_months": 0, "payoff_schedule": []}
+        return {"total_months": 0, "payoff_schedule": [], "total_interest": 0.0, "non_amortizing_debt_ids": []}
+
+    rank = _custom_rank(debts, order) if strategy == "custom" else None
+    # Checked on the starting balances, before an engine moves them.
+    non_amortizing = _non_amortizing_ids(debts)
+    if engine == "numpy":
+        from app.services.debt_numpy import simulate_payoff_numpy
 
+        result = simulate_payoff_numpy(debts, strategy, extra_monthly_payment, rank)
+    elif engine == "event":
+        result = _simulate_events(debts, strategy, extra_monthly_payment, rank)
+    else:
+        result = _simulate_loop(debts, strategy, extra_monthly_payment, rank)
+    result["non_amortizing_debt_ids"] = non_amortizing
+    return result
+
+
+def _non_amortizing_ids(debts: List[DebtItem]) -> List[int]:
+    # Debts whose own payment never covers a month's interest; only the extra
+    # pool can retire them.
+    return [d.id for d in debts if d.minimum + d.extra <= d.balance * ((d.apr or 0) / 100 / 12)]
+
+
+def _simulate_loop(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    rank: Dict[int, int] | None = None,
+):
     payoff_months = {d.id: None for d in debts}
     month = 0
+    total_interest = 0.0
+    for month, interest, _ in iter_loop_months(debts, strategy, extra_monthly_payment, rank, payoff_months):
+        for value in interest:
+            total_interest += value
+
+    payoff_schedule = []
+    for d in debts:
+        payoff_schedule.append(
+            {
+                "debt_id": d.id,
+                "debt_name": d.name,
+                "payoff_months": payoff_months[d.id] or month,
+            }
+        )
+
+    total_months = max(item["payoff_months"] for item in payoff_schedule) if payoff_schedule else 0
+    return {
+        "total_months": total_months,
+        "payoff_schedule": payoff_schedule,
+        "total_interest": round(total_interest, 2),
+    }
+
+
+def iter_loop_months(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    rank: Dict[int, int] | None = None,
+    payoff_months: Dict[int, int | None] | None = None,
+) -> Iterator[Tuple[int, List[float], List[float]]]:
+    # Runs the loop engine one month at a time. Balances are updated on
+    # ``debts`` in place and the yielded lists are aligned with it.
+    if payoff_months is None:
+        payoff_months = {d.id: None for d in debts}
+    month = 0
     rollover_next = 0.0
+    order_key = _order_key(strategy, rank)
+    positions = {d.id: index for index, d in enumerate(debts)}
 
-    while month < 1200:
+    while month < MAX_MONTHS:
         month += 1
         rollover_current = rollover_next
         rollover_next = 0.0
+        interest_paid = [0.0] * len(debts)
+        payments = [0.0] * len(debts)
 
-        for d in debts:
+        for index, d in enumerate(debts):
             if d.balance <= 0:
                 continue
             monthly_rate = (d.apr or 0) / 100 / 12
             if monthly_rate > 0:
-                d.balance += d.balance * monthly_rate
+                interest = d.balance * monthly_rate
+                interest_paid[index] = interest
+                d.balance += interest
 
-        ordered = sorted(
-            debts,
-            key=lambda d: (-d.apr, d.balance) if strategy == "avalanche" else (d.balance, -d.apr),
-        )
+        ordered = sorted(debts, key=order_key)
 
-        for d in debts:
+        for index, d in enumerate(debts):
             if d.balance <= 0:
                 continue
             payment = min(d.balance, d.minimum + d.extra)
             d.balance -= payment
+            payments[index] += payment
             if d.balance <= 0 and payoff_months[d.id] is None:
                 payoff_months[d.id] = month
                 rollover_next += d.minimum + d.extra
@@ -67,6 +164,7 @@ def simulate_payoff(debts: List[DebtItem], strategy: str, extra_monthly_payment:
                     continue
                 payment = min(d.balance, extra_pool)
                 d.balance -= payment
+                payments[positions[d.id]] += payment
                 extra_pool -= payment
                 if d.balance <= 0 and payoff_months[d.id] is None:
                     payoff_months[d.id] = month
@@ -74,19 +172,165 @@ def simulate_payoff(debts: List[DebtItem], strategy: str, extra_monthly_payment:
                 if extra_pool <= 0:
                     break
 
+        yield month, interest_paid, payments
+
         if all(d.balance <= 0 for d in debts):
             break
 
-    payoff_schedule = []
-    for d in debts:
-        payoff_schedule.append(
-            {
-                "debt_id": d.id,
-                "debt_name": d.name,
-                "payoff_months": payoff_months[d.id] or month,
-            }
-        )
 
-    total_months = max(item["payoff_months"] for item in payoff_schedule) if payoff_schedule else 0
-    return {"total_months": total_months, "payoff_schedule": payoff_schedule}
+def _advance_balance(balance: float, rate: float, payment: float, months: int) -> float:
+    if rate == 0:
+        return balance - payment * months
+    growth = (1 + rate) ** months
+    return balance * growth - payment * (growth - 1) / rate
+
+
+def _months_to_payoff(balance: float, rate: float, payment: float) -> float:
+    if payment <= 0 or payment <= balance * rate:
+        return math.inf
+    if rate == 0:
+        months = math.ceil(balance / payment)
+    else:
+        months = math.ceil(math.log(payment / (payment - rate * balance)) / math.log1p(rate))
+    months = max(1, months)
+    # Guard the closed form against rounding at exact payoff boundaries.
+    while months > 1 and _advance_balance(balance, rate, payment, months - 1) <= 0:
+        months -= 1
+    while _advance_balance(balance, rate, payment, months) > 0:
+        months += 1
+    return months
+
+
+def _simulate_events(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    rank: Dict[int, int] | None = None,
+):
+    count = len(debts)
+    balances = [d.balance for d in debts]
+    rates = [(d.apr or 0) / 100 / 12 for d in debts]
+    payments = [d.minimum + d.extra for d in debts]
+    payoff: List[int | None] = [None] * count
+    total_interest = 0.0
+
+    def order(current: List[float]) -> List[int]:
+        if strategy == "avalanche":
+            return sorted(range(count), key=lambda i: (-debts[i].apr, current[i]))
+        if strategy == "snowball":
+            return sorted(range(count), key=lambda i: (current[i], -debts[i].apr))
+        return sorted(range(count), key=lambda i: rank[debts[i].id])
+
+    def target(current: List[float]) -> int | None:
+        grown = [b + b * rates[i] if b > 0 else b for i, b in enumerate(current)]
+        return next((i for i in order(grown) if grown[i] > 0), None)
+
+    def keeps_target(focus: int | None, fixed: List[float], jump: int) -> bool:
+        if focus is None or strategy == "custom":
+            return True
+
+        def grown(i: int, months: int) -> float:
+            balance = _advance_balance(balances[i], rates[i], fixed[i], months)
+            return balance + balance * rates[i]
+
+        for j in range(count):
+            if j == focus or balances[j] <= 0:
+                continue
+            if strategy == "avalanche" and debts[j].apr != debts[focus].apr:
+                continue
+            # Each gap is a sum of two exponentials, so it has at most one
+            # interior extremum; a ternary search finds its minimum.
+            low, high = 0, jump - 1
+            while high - low > 2:
+                left = low + (high - low) // 3
+                right = high - (high - low) // 3
+                if grown(j, left) - grown(focus, left) < grown(j, right) - grown(focus, right):
+                    high = right
+                else:
+                    low = left
+            candidates = {0, jump - 1, *range(low, high + 1)}
+            if min(grown(j, m) - grown(focus, m) for m in candidates) <= 0:
+                return False
+        return True
+
+    def step(month: int, rollover: float) -> float:
+        # One month with exactly the loop engine's semantics.
+        nonlocal total_interest
+        for i in range(count):
+            if balances[i] > 0 and rates[i] > 0:
+                interest = balances[i] * rates[i]
+                total_interest += interest
+                balances[i] += interest
+        ordered = order(balances)
+        rollover_next = 0.0
+        for i in range(count):
+            if balances[i] <= 0:
+                continue
+            balances[i] -= min(balances[i], payments[i])
+            if balances[i] <= 0 and payoff[i] is None:
+                payoff[i] = month
+                rollover_next += payments[i]
+        extra_pool = extra_monthly_payment + rollover
+        if extra_pool > 0:
+            for i in ordered:
+                if balances[i] <= 0:
+                    continue
+                payment = min(balances[i], extra_pool)
+                balances[i] -= payment
+                extra_pool -= payment
+                if balances[i] <= 0 and payoff[i] is None:
+                    payoff[i] = month
+                    rollover_next += payments[i]
+                if extra_pool <= 0:
+                    break
+        return rollover_next
+
+    month = 0
+    rollover = 0.0
+    while month < MAX_MONTHS and any(b > 0 for b in balances):
+        if rollover == 0:
+            # No payoff happens before the next event, so payments stay fixed
+            # and every balance can be advanced in closed form.
+            focus = target(balances)
+            fixed = [
+                payments[i] + (extra_monthly_payment if i == focus and extra_monthly_payment > 0 else 0)
+                for i in range(count)
+            ]
+            next_event = min(
+                (_months_to_payoff(balances[i], rates[i], fixed[i]) for i in range(count) if balances[i] > 0),
+                default=math.inf,
+            )
+            horizon = MAX_MONTHS - month
+            jump = horizon if next_event - 1 >= horizon else int(next_event) - 1
+            while jump > 0 and not keeps_target(focus, fixed, jump):
+                jump //= 2
+            if jump >= horizon:
+                # Nothing pays off and the extra pool never moves: the
+                # remaining debts cannot amortize, so stop at the cap.
+                for i in range(count):
+                    if balances[i] > 0:
+                        advanced = _advance_balance(balances[i], rates[i], fixed[i], horizon)
+                        total_interest += fixed[i] * horizon - (balances[i] - advanced)
+                month = MAX_MONTHS
+                break
+            if jump > 0:
+                for i in range(count):
+                    if balances[i] > 0:
+                        advanced = _advance_balance(balances[i], rates[i], fixed[i], jump)
+                        total_interest += fixed[i] * jump - (balances[i] - advanced)
+                        balances[i] = advanced
+                        if balances[i] <= 0 and payoff[i] is None:
+                            payoff[i] = month + jump
+                month += jump
+        month += 1
+        rollover = step(month, rollover)
 
+    payoff_schedule = [
+        {"debt_id": d.id, "debt_name": d.name, "payoff_months": payoff[i] or month}
+        for i, d in enumerate(debts)
+    ]
+    return {
+        "total_months": max(item["payoff_months"] for item in payoff_schedule),
+        "payoff_schedule": payoff_schedule,
+        "total_interest": round(total_interest, 2),
+    }
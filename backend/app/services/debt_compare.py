@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import math
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, replace
+from typing import List
+
+from app.core.config import get_settings
+from app.services.debt import DebtItem, DebtSimulationError, simulate_payoff
+
+MEMO_MAX_ENTRIES = 512
+COMPARE_STRATEGIES = ("avalanche", "snowball", "custom")
+SWEEP_STRATEGIES = ("avalanche", "snowball")
+MAX_SWEEP_POINTS = 200
+
+_lock = threading.Lock()
+_results: "OrderedDict[str, dict]" = OrderedDict()
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _debt_set_key(debts: List[DebtItem]) -> str:
+    payload = sorted((asdict(d) for d in debts), key=lambda d: d["id"])
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _fingerprint(
+    debt_key: str,
+    strategy: str,
+    extra_monthly_payment: float,
+    engine: str,
+    order: List[int] | None,
+) -> str:
+    strategy = strategy.lower().strip()
+    payload = {
+        "debts": debt_key,
+        "strategy": strategy,
+        "extra": extra_monthly_payment,
+        "engine": engine.lower().strip(),
+        "order": list(order or []) if strategy == "custom" else [],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _memo_get(key: str) -> dict | None:
+    with _lock:
+        cached = _results.get(key)
+        if cached is None:
+            return None
+        _results.move_to_end(key)
+        return copy.deepcopy(cached)
+
+
+def _memo_put(key: str, result: dict) -> None:
+    with _lock:
+        _results[key] = copy.deepcopy(result)
+        while len(_results) > MEMO_MAX_ENTRIES:
+            _results.popitem(last=False)
+
+
+def _simulate(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    engine: str,
+    order: List[int] | None,
+) -> dict:
+    # Engines mutate balances, so simulate on copies and keep the inputs intact.
+    return simulate_payoff(
+        [replace(d) for d in debts], strategy, extra_monthly_payment, engine=engine, order=order
+    )
+
+
+def simulate_cached(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    engine: str = "loop",
+    order: List[int] | None = None,
+) -> dict:
+    key = _fingerprint(_debt_set_key(debts), strategy, extra_monthly_payment, engine, order)
+    cached = _memo_get(key)
+    if cached is not None:
+        return cached
+
+    result = _simulate(debts, strategy, extra_monthly_payment, engine, order)
+    _memo_put(key, result)
+    return result
+
+
+def compare_strategies(
+    debts: List[DebtItem],
+    extra_monthly_payment: float,
+    order: List[int] | None = None,
+    engine: str = "loop",
+) -> List[dict]:
+    return [
+        {"strategy": strategy, **simulate_cached(debts, strategy, extra_monthly_payment, engine, order)}
+        for strategy in COMPARE_STRATEGIES
+    ]
+
+
+def get_simulation_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    workers = get_settings().debt_sweep_workers
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Forking a threaded server copies held locks and open database
+            # connections into the workers, so start them clean instead.
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(method)
+            )
+        return _pool
+
+
+def shutdown_sweep_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def sweep_points(extra_start: float, extra_stop: float, extra_step: float) -> List[float]:
+    if extra_start < 0 or extra_stop < extra_start:
+        raise DebtSimulationError("Sweep range must satisfy 0 <= extra_start <= extra_stop.")
+    if extra_step <= 0:
+        raise DebtSimulationError("extra_step must be greater than zero.")
+
+    count = math.floor((extra_stop - extra_start) / extra_step + 1e-9) + 1
+    if count > MAX_SWEEP_POINTS:
+        raise DebtSimulationError(f"Sweep is limited to {MAX_SWEEP_POINTS} points.")
+    return [round(extra_start + i * extra_step, 2) for i in range(count)]
+
+
+def sweep_extra_payments(
+    debts: List[DebtItem],
+    extras: List[float],
+    strategies: List[str] | None = None,
+    engine: str = "event",
+) -> List[dict]:
+    strategies = [s.lower().strip() for s in (strategies or SWEEP_STRATEGIES)]
+    for strategy in strategies:
+        if strategy not in SWEEP_STRATEGIES:
+            raise DebtSimulationError("Sweep strategies must be avalanche or snowball.")
+
+    # The debt-set digest and the positive-balance inputs are shared by every point.
+    debt_key = _debt_set_key(debts)
+    active = [d for d in debts if d.balance > 0]
+
+    keys = {
+        (strategy, extra): _fingerprint(debt_key, strategy, extra, engine, None)
+        for strategy in strategies
+        for extra in extras
+    }
+    results: dict = {}
+    missing = []
+    for point, key in keys.items():
+        cached = _memo_get(key)
+        if cached is None:
+            missing.append(point)
+        else:
+            results[point] = cached
+
+    pool = get_simulation_pool() if len(missing) > 1 else None
+    if pool is not None:
+        futures = {
+            point: pool.submit(simulate_payoff, active, point[0], point[1], engine)
+            for point in missing
+        }
+        computed = {point: future.result() for point, future in futures.items()}
+    else:
+        computed = {point: _simulate(active, point[0], point[1], engine, None) for point in missing}
+
+    for point, result in computed.items():
+        _memo_put(keys[point], result)
+        results[point] = result
+
+    return [
+        {
+            "strategy": strategy,
+            "total_months": [results[(strategy, extra)]["total_months"] for extra in extras],
+            "total_interest": [results[(strategy, extra)]["total_interest"] for extra in extras],
+        }
+        for strategy in strategies
+    ]
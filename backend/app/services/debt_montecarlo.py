@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import List
+
+import numpy as np
+
+from app.services.debt import MAX_MONTHS, STRATEGIES, DebtItem, DebtSimulationError, _custom_rank
+from app.services.debt_compare import get_simulation_pool
+
+MAX_TRIALS = 20000
+TRIALS_PER_CHUNK = 1000
+PERCENTILES = (10, 50, 90)
+
+
+class SimulationBudgetExceeded(DebtSimulationError):
+    pass
+
+
+def _run_chunk(
+    balances: List[float],
+    aprs: List[float],
+    payments: List[float],
+    strategy: str,
+    rank: List[int],
+    extra_monthly_payment: float,
+    apr_volatility: float,
+    extra_volatility: float,
+    trials: int,
+    seed: np.random.SeedSequence,
+    cpu_budget: float,
+):
+    # Same monthly steps as the loop engine, vectorized over trials: interest,
+    # minimums, then the extra pool (plus last month's rollover) in strategy order.
+    rng = np.random.default_rng(seed)
+    started = time.thread_time()
+
+    debt_count = len(balances)
+    balance = np.tile(np.asarray(balances, dtype=np.float64), (trials, 1))
+    apr = np.tile(np.asarray(aprs, dtype=np.float64), (trials, 1))
+    payment = np.asarray(payments, dtype=np.float64)
+    custom_order = np.tile(np.argsort(np.asarray(rank), kind="stable"), (trials, 1))
+    payoff = np.zeros((trials, debt_count), dtype=np.int32)
+    total_interest = np.zeros(trials, dtype=np.float64)
+    rollover_next = np.zeros(trials, dtype=np.float64)
+    rows = np.arange(trials)[:, None]
+
+    month = 0
+    while month < MAX_MONTHS:
+        month += 1
+        if time.thread_time() - started > cpu_budget:
+            raise SimulationBudgetExceeded(
+                "Simulation exceeded its CPU budget; reduce trials or volatility."
+            )
+
+        rollover_current = rollover_next
+        rollover_next = np.zeros(trials, dtype=np.float64)
+
+        if apr_volatility > 0:
+            apr = np.maximum(apr + rng.normal(0.0, apr_volatility, apr.shape), 0.0)
+        interest = balance * (apr / 100 / 12)
+        total_interest += interest.sum(axis=1)
+        balance += interest
+
+        if strategy == "avalanche":
+            ordered = np.lexsort((balance, -apr), axis=-1)
+        elif strategy == "snowball":
+            ordered = np.lexsort((-apr, balance), axis=-1)
+        else:
+            ordered = custom_order
+
+        balance -= np.minimum(balance, payment)
+        paid = (balance <= 0) & (payoff == 0)
+        payoff[paid] = month
+        rollover_next += (paid * payment).sum(axis=1)
+
+        extra = np.full(trials, extra_monthly_payment, dtype=np.float64)
+        if extra_volatility > 0 and extra_monthly_payment > 0:
+            extra = np.maximum(extra * (1 + rng.normal(0.0, extra_volatility, trials)), 0.0)
+        extra_pool = extra + rollover_current
+
+        ordered_balance = balance[rows, ordered]
+        before = np.cumsum(ordered_balance, axis=1) - ordered_balance
+        applied = np.minimum(ordered_balance, np.maximum(extra_pool[:, None] - before, 0.0))
+        balance[rows, ordered] = ordered_balance - applied
+        paid = (balance <= 0) & (payoff == 0)
+        payoff[paid] = month
+        rollover_next += (paid * payment).sum(axis=1)
+
+        if np.all(balance <= 0):
+            break
+
+    payoff[payoff == 0] = month
+    return payoff, total_interest
+
+
+def _percentiles(values: np.ndarray) -> dict:
+    points = np.percentile(values, PERCENTILES, method="higher")
+    return {f"p{p}": float(v) for p, v in zip(PERCENTILES, points)}
+
+
+def simulate_payoff_monte_carlo(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    trials: int = 2000,
+    apr_volatility: float = 0.25,
+    extra_volatility: float = 0.2,
+    seed: int | None = None,
+    order: List[int] | None = None,
+    cpu_budget_seconds: float = 5.0,
+):
+    strategy = strategy.lower().strip()
+    if strategy not in STRATEGIES:
+        raise DebtSimulationError("Strategy must be avalanche, snowball or custom.")
+    if not 1 <= trials <= MAX_TRIALS:
+        raise DebtSimulationError(f"Trials must be between 1 and {MAX_TRIALS}.")
+    if apr_volatility < 0 or extra_volatility < 0:
+        raise DebtSimulationError("Volatility must not be negative.")
+
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % 2**32)
+
+    debts = [d for d in debts if d.balance > 0]
+    if not debts:
+        return {
+            "trials": trials,
+            "seed": seed,
+            "total_months": _percentiles(np.zeros(1)),
+            "total_interest": _percentiles(np.zeros(1)),
+            "payoff_schedule": [],
+        }
+
+    rank = _custom_rank(debts, order)
+    args = (
+        [d.balance for d in debts],
+        [d.apr or 0 for d in debts],
+        [d.minimum + d.extra for d in debts],
+        strategy,
+        [rank[d.id] for d in debts],
+        extra_monthly_payment,
+        apr_volatility,
+        extra_volatility,
+    )
+
+    # Chunking and seeding depend only on the trial count, so a seed gives the
+    # same answer whether chunks run in-process or on the pool.
+    chunk_count = math.ceil(trials / TRIALS_PER_CHUNK)
+    sizes = [min(TRIALS_PER_CHUNK, trials - i * TRIALS_PER_CHUNK) for i in range(chunk_count)]
+    seeds = np.random.SeedSequence(seed).spawn(chunk_count)
+    chunk_budget = cpu_budget_seconds / chunk_count
+
+    pool = get_simulation_pool() if chunk_count > 1 else None
+    if pool is not None:
+        futures = [
+            pool.submit(_run_chunk, *args, size, chunk_seed, chunk_budget)
+            for size, chunk_seed in zip(sizes, seeds)
+        ]
+        chunks = [future.result() for future in futures]
+    else:
+        chunks = [
+            _run_chunk(*args, size, chunk_seed, chunk_budget)
+            for size, chunk_seed in zip(sizes, seeds)
+        ]
+
+    payoff = np.concatenate([chunk[0] for chunk in chunks])
+    total_interest = np.concatenate([chunk[1] for chunk in chunks])
+
+    payoff_schedule = [
+        {
+            "debt_id": d.id,
+            "debt_name": d.name,
+            "payoff_months": _percentiles(payoff[:, index]),
+            "unpaid_share": round(float(np.mean(payoff[:, index] >= MAX_MONTHS)), 4),
+        }
+        for index, d in enumerate(debts)
+    ]
+    return {
+        "trials": trials,
+        "seed": seed,
+        "total_months": _percentiles(payoff.max(axis=1)),
+        "total_interest": {k: round(v, 2) for k, v in _percentiles(total_interest).items()},
+        "payoff_schedule": payoff_schedule,
+    }
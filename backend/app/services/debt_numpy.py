@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.debt import MAX_MONTHS, DebtItem
+
+
+def simulate_payoff_numpy(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    rank: Dict[int, int] | None = None,
+):
+    # Mirrors the loop engine operation for operation so results are bit-identical;
+    # only the per-debt work inside each month is vectorized.
+    balances = np.array([d.balance for d in debts], dtype=np.float64)
+    aprs = np.array([d.apr for d in debts], dtype=np.float64)
+    rates = np.array([(d.apr or 0) / 100 / 12 for d in debts], dtype=np.float64)
+    payments = np.array([d.minimum + d.extra for d in debts], dtype=np.float64)
+    payoff = np.zeros(len(debts), dtype=np.int64)
+    total_interest = 0.0
+    if strategy == "custom":
+        custom_order = np.argsort(np.array([rank[d.id] for d in debts]), kind="stable")
+
+    month = 0
+    rollover_next = 0.0
+    while month < MAX_MONTHS:
+        month += 1
+        rollover_current = rollover_next
+        rollover_next = 0.0
+
+        # Paid-off balances are exactly zero and zero rates add exactly zero,
+        # so no masking is needed to match the loop engine.
+        interest = balances * rates
+        # Accumulate left to right so the float total matches the loop engine.
+        total_interest = np.add.accumulate(np.concatenate(([total_interest], interest)))[-1]
+        balances += interest
+
+        if strategy == "avalanche":
+            ordered = np.lexsort((balances, -aprs))
+        elif strategy == "snowball":
+            ordered = np.lexsort((-aprs, balances))
+        else:
+            ordered = custom_order
+
+        balances -= np.minimum(balances, payments)
+        for index in np.flatnonzero((balances <= 0) & (payoff == 0)):
+            payoff[index] = month
+            rollover_next += payments[index]
+
+        extra_pool = extra_monthly_payment + rollover_current
+        if extra_pool > 0:
+            ordered_balances = balances[ordered]
+            remaining = np.subtract.accumulate(np.concatenate(([extra_pool], ordered_balances)))[:-1]
+            extra = np.minimum(ordered_balances, np.maximum(remaining, 0.0))
+            paying = extra > 0
+            touched = ordered[paying]
+            balances[touched] -= extra[paying]
+            for index in touched[(balances[touched] <= 0) & (payoff[touched] == 0)]:
+                payoff[index] = month
+                rollover_next += payments[index]
+
+        if np.all(balances <= 0):
+            break
+
+    payoff_schedule = [
+        {
+            "debt_id": d.id,
+            "debt_name": d.name,
+            "payoff_months": int(payoff[index]) or month,
+        }
+        for index, d in enumerate(debts)
+    ]
+    total_months = max(item["payoff_months"] for item in payoff_schedule)
+    return {
+        "total_months": total_months,
+        "payoff_schedule": payoff_schedule,
+        "total_interest": round(float(total_interest), 2),
+    }
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from typing import Iterator, List, Tuple
+
+from app.services.debt import STRATEGIES, DebtItem, DebtSimulationError, _custom_rank, iter_loop_months
+
+SCHEDULE_BATCH_SIZE = 1000
+
+
+def prepare_schedule(
+    debts: List[DebtItem], strategy: str, order: List[int] | None = None
+) -> Tuple[List[DebtItem], str, dict | None]:
+    strategy = strategy.lower().strip()
+    if strategy not in STRATEGIES:
+        raise DebtSimulationError("Strategy must be avalanche, snowball or custom.")
+
+    active = [replace(d) for d in debts if d.balance > 0]
+    rank = _custom_rank(active, order) if strategy == "custom" else None
+    return active, strategy, rank
+
+
+def iter_schedule_rows(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    rank: dict | None = None,
+) -> Iterator[Tuple[int, int, float, float, float]]:
+    # Yields (month, debt_id, balance, interest, principal); debts already
+    # paid off before a month starts are left out of that month.
+    open_debts = {d.id for d in debts}
+    for month, interest, payments in iter_loop_months(debts, strategy, extra_monthly_payment, rank):
+        for index, d in enumerate(debts):
+            if d.id not in open_debts:
+                continue
+            yield (
+                month,
+                d.id,
+                round(max(d.balance, 0.0), 2),
+                round(interest[index], 2),
+                round(payments[index] - interest[index], 2),
+            )
+            if d.balance <= 0:
+                open_debts.discard(d.id)
+
+
+def iter_schedule_ndjson(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    rank: dict | None = None,
+) -> Iterator[str]:
+    lines: list[str] = []
+    for month, debt_id, balance, interest, principal in iter_schedule_rows(
+        debts, strategy, extra_monthly_payment, rank
+    ):
+        lines.append(
+            json.dumps(
+                {
+                    "month": month,
+                    "debt_id": debt_id,
+                    "balance": balance,
+                    "interest": interest,
+                    "principal": principal,
+                }
+            )
+            + "\n"
+        )
+        if len(lines) >= SCHEDULE_BATCH_SIZE:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def build_schedule_columns(
+    debts: List[DebtItem],
+    strategy: str,
+    extra_monthly_payment: float,
+    rank: dict | None = None,
+) -> dict:
+    columns = {
+        d.id: {"debt_id": d.id, "debt_name": d.name, "balance": [], "interest": [], "principal": []}
+        for d in debts
+    }
+    months = 0
+    for month, debt_id, balance, interest, principal in iter_schedule_rows(
+        debts, strategy, extra_monthly_payment, rank
+    ):
+        months = month
+        column = columns[debt_id]
+        column["balance"].append(balance)
+        column["interest"].append(interest)
+        column["principal"].append(principal)
+    return {"months": months, "debts": list(columns.values())}
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import date
+from typing import Iterator
+
+from app import models
+from app.db import SessionLocal
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = ["id", "date", "amount", "category_id", "category", "note", "created_at"]
+
+
+def iter_expense_rows(user_id: int, start: date, end: date) -> Iterator[dict]:
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(
+                models.Expense.id,
+                models.Expense.date,
+                models.Expense.amount,
+                models.Expense.category_id,
+                models.Category.name,
+                models.Expense.note,
+                models.Expense.created_at,
+            )
+            .outerjoin(models.Category, models.Category.id == models.Expense.category_id)
+            .filter(
+                models.Expense.user_id == user_id,
+                models.Expense.date >= start,
+                models.Expense.date <= end,
+            )
+            .order_by(models.Expense.date, models.Expense.id)
+            .execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+        )
+        for row in rows:
+            yield {
+                "id": row[0],
+                "date": row[1].isoformat(),
+                "amount": float(row[2]),
+                "category_id": row[3],
+                "category": row[4],
+                "note": row[5],
+                "created_at": row[6].isoformat() if row[6] else None,
+            }
+    finally:
+        db.close()
+
+
+def iter_expenses_csv(user_id: int, start: date, end: date) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for index, row in enumerate(iter_expense_rows(user_id, start, end), start=1):
+        writer.writerow(row)
+        if index % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_expenses_ndjson(user_id: int, start: date, end: date) -> Iterator[str]:
+    lines: list[str] = []
+    for row in iter_expense_rows(user_id, start, end):
+        lines.append(json.dumps(row) + "\n")
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app import models
+from app.schemas import ExpenseCreate
+from app.services.budget import ensure_uncategorized
+from app.services.expense_rollups import apply_expense_delta
+from app.services.summary_cache import bump_user_version
+
+IMPORT_CHUNK_SIZE = 500
+
+
+@dataclass
+class ExpenseImportContext:
+    user_id: int
+    category_ids: set[int]
+    category_names: dict[str, int]
+    uncategorized_id: int
+    inserted: int = 0
+    errors: list[dict] = field(default_factory=list)
+    months: set[tuple[int, int]] = field(default_factory=set)
+
+
+def prepare_expense_import(db: Session, user_id: int) -> ExpenseImportContext:
+    uncategorized = ensure_uncategorized(db, user_id)
+    categories = (
+        db.query(models.Category)
+        .filter(models.Category.user_id == user_id, models.Category.is_active.is_(True))
+        .all()
+    )
+    return ExpenseImportContext(
+        user_id=user_id,
+        category_ids={c.id for c in categories},
+        category_names={c.name.strip().lower(): c.id for c in categories},
+        uncategorized_id=uncategorized.id,
+    )
+
+
+def _resolve_row(context: ExpenseImportContext, raw: dict) -> dict:
+    data = dict(raw)
+    category_name = data.pop("category", None)
+    if data.get("category_id") in ("", None):
+        data["category_id"] = None
+    if data.get("note") == "":
+        data["note"] = None
+    payload = ExpenseCreate.model_validate(data)
+
+    category_id = payload.category_id
+    if category_id:
+        if category_id not in context.category_ids:
+            raise ValueError("Category not found")
+    elif category_name and str(category_name).strip():
+        category_id = context.category_names.get(str(category_name).strip().lower())
+        if category_id is None:
+            raise ValueError(f"Category '{category_name}' not found")
+    else:
+        category_id = context.uncategorized_id
+
+    return {
+        "user_id": context.user_id,
+        "category_id": category_id,
+        "amount": payload.amount,
+        "date": payload.date,
+        "note": payload.note,
+    }
+
+
+def import_expense_chunk(
+    db: Session, context: ExpenseImportContext, rows: list[tuple[int, dict]]
+) -> None:
+    batch: list[dict] = []
+    for row_number, raw in rows:
+        try:
+            batch.append(_resolve_row(context, raw))
+        except ValidationError as exc:
+            context.errors.append({"row": row_number, "error": exc.errors()[0]["msg"]})
+        except (TypeError, ValueError) as exc:
+            context.errors.append({"row": row_number, "error": str(exc)})
+    if not batch:
+        return
+
+    db.execute(insert(models.Expense), batch)
+    deltas: dict[tuple[int, int, int], list[float]] = defaultdict(lambda: [0.0, 0])
+    for item in batch:
+        expense_date: date = item["date"]
+        key = (expense_date.year, expense_date.month, item["category_id"])
+        deltas[key][0] += float(item["amount"])
+        deltas[key][1] += 1
+    for (year, month, category_id), (amount, count) in deltas.items():
+        apply_expense_delta(db, context.user_id, year, month, category_id, amount, count)
+        context.months.add((year, month))
+    db.commit()
+    bump_user_version(context.user_id)
+    context.inserted += len(batch)
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+
+from sqlalchemy import extract, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app import models
+from app.db import SessionLocal
+
+
+def _rollup_query(db: Session, user_id: int, year: int, month: int, category_id: int | None):
+    return db.query(models.ExpenseMonthRollup).filter(
+        models.ExpenseMonthRollup.user_id == user_id,
+        models.ExpenseMonthRollup.year == year,
+        models.ExpenseMonthRollup.month == month,
+        models.ExpenseMonthRollup.category_id == category_id,
+    )
+
+
+def apply_expense_delta(
+    db: Session,
+    user_id: int,
+    year: int,
+    month: int,
+    category_id: int | None,
+    amount: float,
+    count: int,
+) -> None:
+    now = datetime.utcnow()
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        # A single upsert, so concurrent first writes for a new month and
+        # category add up instead of racing on the unique constraint.
+        insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+        table = models.ExpenseMonthRollup.__table__
+        stmt = insert(table).values(
+            user_id=user_id,
+            year=year,
+            month=month,
+            category_id=category_id,
+            total=amount,
+            count=count,
+            updated_at=now,
+        )
+        if category_id is None:
+            target = {
+                "index_elements": [table.c.user_id, table.c.year, table.c.month],
+                "index_where": table.c.category_id.is_(None),
+            }
+        else:
+            target = {
+                "index_elements": [table.c.user_id, table.c.year, table.c.month, table.c.category_id]
+            }
+        db.execute(
+            stmt.on_conflict_do_update(
+                **target,
+                set_={
+                    "total": table.c.total + stmt.excluded.total,
+                    "count": table.c.count + stmt.excluded.count,
+                    "updated_at": now,
+                },
+            )
+        )
+    else:
+        query = _rollup_query(db, user_id, year, month, category_id)
+        updated = query.update(
+            {
+                models.ExpenseMonthRollup.total: models.ExpenseMonthRollup.total + amount,
+                models.ExpenseMonthRollup.count: models.ExpenseMonthRollup.count + count,
+                models.ExpenseMonthRollup.updated_at: now,
+            },
+            synchronize_session=False,
+        )
+        if not updated:
+            if count <= 0:
+                return
+            db.add(
+                models.ExpenseMonthRollup(
+                    user_id=user_id,
+                    year=year,
+                    month=month,
+                    category_id=category_id,
+                    total=amount,
+                    count=count,
+                )
+            )
+            db.flush()
+
+    if count < 0:
+        _rollup_query(db, user_id, year, month, category_id).filter(
+            models.ExpenseMonthRollup.count <= 0
+        ).delete(synchronize_session=False)
+
+
+def record_expense(db: Session, expense: models.Expense) -> None:
+    apply_expense_delta(
+        db,
+        expense.user_id,
+        expense.date.year,
+        expense.date.month,
+        expense.category_id,
+        float(expense.amount or 0),
+        1,
+    )
+
+
+def remove_expense(db: Session, expense: models.Expense) -> None:
+    apply_expense_delta(
+        db,
+        expense.user_id,
+        expense.date.year,
+        expense.date.month,
+        expense.category_id,
+        -float(expense.amount or 0),
+        -1,
+    )
+
+
+def move_category_rollups(
+    db: Session, user_id: int, from_category_id: int, to_category_id: int
+) -> None:
+    rows = (
+        db.query(models.ExpenseMonthRollup)
+        .filter(
+            models.ExpenseMonthRollup.user_id == user_id,
+            models.ExpenseMonthRollup.category_id == from_category_id,
+        )
+        .all()
+    )
+    for row in rows:
+        year, month, total, count = row.year, row.month, float(row.total or 0), row.count
+        db.delete(row)
+        db.flush()
+        apply_expense_delta(db, user_id, year, month, to_category_id, total, count)
+
+
+def _aggregate_expenses(db: Session, user_id: int | None = None):
+    year_col = extract("year", models.Expense.date)
+    month_col = extract("month", models.Expense.date)
+    query = db.query(
+        models.Expense.user_id,
+        year_col,
+        month_col,
+        models.Expense.category_id,
+        func.sum(models.Expense.amount),
+        func.count(models.Expense.id),
+    )
+    if user_id is not None:
+        query = query.filter(models.Expense.user_id == user_id)
+    rows = query.group_by(models.Expense.user_id, year_col, month_col, models.Expense.category_id).all()
+    return {
+        (row[0], int(row[1]), int(row[2]), row[3]): (float(row[4] or 0), int(row[5]))
+        for row in rows
+    }
+
+
+def rebuild_rollups(db: Session, user_id: int | None = None) -> int:
+    query = db.query(models.ExpenseMonthRollup)
+    if user_id is not None:
+        query = query.filter(models.ExpenseMonthRollup.user_id == user_id)
+    query.delete(synchronize_session=False)
+
+    aggregates = _aggregate_expenses(db, user_id)
+    for (row_user_id, year, month, category_id), (total, count) in aggregates.items():
+        db.add(
+            models.ExpenseMonthRollup(
+                user_id=row_user_id,
+                year=year,
+                month=month,
+                category_id=category_id,
+                total=total,
+                count=count,
+            )
+        )
+    db.commit()
+    return len(aggregates)
+
+
+def verify_rollups(db: Session, user_id: int | None = None, tolerance: float = 0.005) -> list[dict]:
+    expected = _aggregate_expenses(db, user_id)
+    query = db.query(models.ExpenseMonthRollup)
+    if user_id is not None:
+        query = query.filter(models.ExpenseMonthRollup.user_id == user_id)
+    actual = {
+        (row.user_id, row.year, row.month, row.category_id): (float(row.total or 0), row.count)
+        for row in query.all()
+    }
+
+    mismatches = []
+    for key in sorted(set(expected) | set(actual), key=str):
+        expected_total, expected_count = expected.get(key, (0.0, 0))
+        actual_total, actual_count = actual.get(key, (0.0, 0))
+        if expected_count != actual_count or abs(expected_total - actual_total) > tolerance:
+            mismatches.append(
+                {
+                    "user_id": key[0],
+                    "year": key[1],
+                    "month": key[2],
+                    "category_id": key[3],
+                    "expected_total": expected_total,
+                    "actual_total": actual_total,
+                    "expected_count": expected_count,
+                    "actual_count": actual_count,
+                }
+            )
+    return mismatches
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild or verify expense month rollups.")
+    parser.add_argument("command", choices=["rebuild", "verify"])
+    parser.add_argument("--user-id", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            written = rebuild_rollups(db, args.user_id)
+            print(f"Rebuilt {written} rollup rows.")
+            return 0
+        mismatches = verify_rollups(db, args.user_id)
+        for item in mismatches:
+            print(item)
+        print(f"{len(mismatches)} mismatched rollup rows.")
+        return 1 if mismatches else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app import models
+from app.core.config import get_settings
+
+_lock = threading.Lock()
+_entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+_columns = [attr.key for attr in inspect(models.User).column_attrs]
+
+
+def get_cached_principal(db: Session, subject: str) -> models.User | None:
+    settings = get_settings()
+    if not settings.principal_cache_enabled:
+        return None
+
+    with _lock:
+        entry = _entries.get(subject)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del _entries[subject]
+            _stats["misses"] += 1
+            return None
+        _entries.move_to_end(subject)
+        _stats["hits"] += 1
+        values = entry[1]
+
+    # Rebuild the row as a clean detached instance and attach it without a
+    # SELECT, so handlers still get a session-bound user they can update.
+    user = models.User(**values)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def cache_principal(subject: str, user: models.User) -> None:
+    settings = get_settings()
+    if not settings.principal_cache_enabled or settings.principal_cache_max_entries <= 0:
+        return
+
+    values = {key: getattr(user, key) for key in _columns}
+    expires_at = time.monotonic() + settings.principal_cache_ttl_seconds
+    with _lock:
+        _entries[subject] = (expires_at, values)
+        _entries.move_to_end(subject)
+        while len(_entries) > settings.principal_cache_max_entries:
+            _entries.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def invalidate_principal(subject: str) -> None:
+    with _lock:
+        if _entries.pop(subject, None) is not None:
+            _stats["invalidations"] += 1
+
+
+def clear_principal_cache() -> None:
+    with _lock:
+        _entries.clear()
+
+
+def principal_cache_stats() -> dict:
+    settings = get_settings()
+    with _lock:
+        return {
+            "enabled": settings.principal_cache_enabled,
+            "ttl_seconds": settings.principal_cache_ttl_seconds,
+            "max_entries": settings.principal_cache_max_entries,
+            "size": len(_entries),
+            **_stats,
+        }
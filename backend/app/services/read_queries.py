@@ -0,0 +1,53 @@
+from calendar import monthrange
+from datetime import date
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query, Session
+
+from app import models
+
+# List queries shared by the sync routers and the async read endpoints, so
+# both stacks filter and page identically. Callers apply the ordering and
+# cursor through paginate() with the matching *_PAGE_COLUMNS.
+EXPENSE_PAGE_COLUMNS = [models.Expense.date, models.Expense.id]
+TASK_PAGE_COLUMNS = [models.Task.created_at, models.Task.id]
+ALERT_PAGE_COLUMNS = [models.Alert.created_at, models.Alert.id]
+
+
+def expenses_query(db: Session, user_id: int, year: int, month: int) -> Query:
+    start = date(year, month, 1)
+    end = date(year, month, monthrange(year, month)[1])
+    return db.query(models.Expense).filter(
+        models.Expense.user_id == user_id,
+        models.Expense.date >= start,
+        models.Expense.date <= end,
+    )
+
+
+def tasks_query(db: Session, user_id: int, year: int | None, month: int | None) -> Query:
+    query = db.query(models.Task).filter(models.Task.user_id == user_id)
+    if year and month:
+        month_start = date(year, month, 1)
+        if month == 12:
+            next_month = date(year + 1, 1, 1)
+        else:
+            next_month = date(year, month + 1, 1)
+        query = query.filter(
+            or_(
+                and_(models.Task.due_date >= month_start, models.Task.due_date < next_month),
+                models.Task.due_date < month_start,
+            )
+        ).filter(models.Task.status != "completed")
+    return query
+
+
+def alerts_query(db: Session, user_id: int, year: int, month: int) -> Query:
+    return db.query(models.Alert).filter(
+        models.Alert.user_id == user_id,
+        models.Alert.year == year,
+        models.Alert.month == month,
+    )
+
+
+def debts_query(db: Session, user_id: int) -> Query:
+    return db.query(models.Debt).filter(models.Debt.user_id == user_id, models.Debt.is_active.is_(True))
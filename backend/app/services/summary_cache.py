@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.services.budget import compute_budget_summary
+
+_lock = threading.Lock()
+_entries: "OrderedDict[tuple, dict]" = OrderedDict()
+_versions: dict[int, int] = {}
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def bump_user_version(user_id: int) -> None:
+    with _lock:
+        _versions[user_id] = _versions.get(user_id, 0) + 1
+
+
+def get_budget_summary(db: Session, user_id: int, year: int, month: int) -> dict:
+    settings = get_settings()
+    if not settings.summary_cache_enabled or settings.summary_cache_max_entries <= 0:
+        return compute_budget_summary(db, user_id, year, month)
+
+    with _lock:
+        # The projection depends on today's date, so a new day is a new key.
+        key = (user_id, year, month, _versions.get(user_id, 0), date.today())
+        cached = _entries.get(key)
+        if cached is not None:
+            _entries.move_to_end(key)
+            _stats["hits"] += 1
+            return copy.deepcopy(cached)
+        _stats["misses"] += 1
+
+    summary = compute_budget_summary(db, user_id, year, month)
+
+    with _lock:
+        if key[3] == _versions.get(user_id, 0):
+            _entries[key] = copy.deepcopy(summary)
+            _entries.move_to_end(key)
+            while len(_entries) > settings.summary_cache_max_entries:
+                _entries.popitem(last=False)
+                _stats["evictions"] += 1
+    return summary
+
+
+def clear_summary_cache() -> None:
+    with _lock:
+        _entries.clear()
+
+
+def summary_cache_stats() -> dict:
+    settings = get_settings()
+    with _lock:
+        return {
+            "enabled": settings.summary_cache_enabled,
+            "max_entries": settings.summary_cache_max_entries,
+            "size": len(_entries),
+            **_stats,
+        }
@@ -1,69 +1,115 @@
 from __future__ import annotations
 
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import update
 
 from app import models
 from app.db import SessionLocal
+from app.services.alerts import insert_alerts
 
 VALID_STATUSES = {"pending", "in_progress", "completed", "overdue"}
+DEFAULT_ALERT_TIME = time(hour=9, minute=0)
+
+
+def task_notify_at(task: models.Task) -> datetime | None:
+    if task.due_date is None or task.alert_offset_minutes is None or task.status == "completed":
+        return None
+    base_time = task.alert_time or DEFAULT_ALERT_TIME
+    return datetime.combine(task.due_date, base_time) - timedelta(minutes=task.alert_offset_minutes)
+
+
+def refresh_next_notify_at(task: models.Task) -> datetime | None:
+    notify_at = task_notify_at(task)
+    if notify_at is not None and task.last_alerted_at and task.last_alerted_at >= notify_at:
+        notify_at = None
+    task.next_notify_at = notify_at
+    return notify_at
+
+
+def _scoped_update(user_id: int | None):
+    stmt = update(models.Task).where(models.Task.due_date.isnot(None))
+    if user_id is not None:
+        stmt = stmt.where(models.Task.user_id == user_id)
+    return stmt.execution_options(synchronize_session=False)
+
+
+def normalize_task_statuses(db, user_id: int | None = None) -> int:
+    result = db.execute(
+        _scoped_update(user_id)
+        .where(models.Task.status.notin_(VALID_STATUSES))
+        .values(status="pending")
+    )
+    return result.rowcount
+
+
+def mark_overdue_tasks(db, today: date, user_id: int | None = None) -> int:
+    result = db.execute(
+        _scoped_update(user_id)
+        .where(models.Task.due_date < today)
+        .where(models.Task.status.notin_(("completed", "overdue")))
+        .values(status="overdue", is_completed=False)
+    )
+    return result.rowcount
 
 
 def process_task_alerts(db, user_id: int | None = None, now: datetime | None = None) -> int:
     now = now or datetime.utcnow()
     today = now.date()
-    sent_count = 0
+    pending: list[dict] = []
+
+    normalize_task_statuses(db, user_id)
+    mark_overdue_tasks(db, today, user_id)
 
     query = db.query(models.Task)
     if user_id is not None:
         query = query.filter(models.Task.user_id == user_id)
 
-    tasks = (
-        query.filter(models.Task.due_date.isnot(None))
+    due_tasks = (
+        query.filter(models.Task.next_notify_at <= now)
         .filter(models.Task.status != "completed")
+        .order_by(models.Task.next_notify_at)
         .all()
     )
 
-    for task in tasks:
-        if task.status not in VALID_STATUSES:
-            task.status = "pending"
-
-        if task.due_date and task.due_date < today and task.status != "overdue":
-            task.status = "overdue"
-            task.is_completed = False
-
-        if task.alert_offset_minutes is None:
-            continue
-
-        base_time = task.alert_time or time(hour=9, minute=0)
-        notify_at = datetime.combine(task.due_date, base_time) - timedelta(
-            minutes=task.alert_offset_minutes
-        )
-        if now < notify_at:
-            continue
-        if task.last_alerted_at and task.last_alerted_at >= notify_at:
-            continue
-
+    for task in due_tasks:
+        notify_at = task.next_notify_at
         message = f"Task alert: '{task.title}' due {task.due_date}"
-        alert = models.Alert(
-            user_id=task.user_id,
-            category_id=None,
-            year=task.due_date.year if task.due_date else today.year,
-            month=task.due_date.month if task.due_date else today.month,
-            code="TASK_ALERT",
-            level="warning" if task.status == "overdue" else "info",
-            message=message,
+        pending.append(
+            {
+                "user_id": task.user_id,
+                "category_id": None,
+                "year": task.due_date.year if task.due_date else today.year,
+                "month": task.due_date.month if task.due_date else today.month,
+                "code": f"TASK_ALERT-{task.id}-{notify_at:%Y%m%d%H%M}",
+                "level": "warning" if task.status == "overdue" else "info",
+                "message": message,
+            }
         )
-        db.add(alert)
         task.last_alerted_at = now
-        sent_count += 1
+        task.next_notify_at = None
 
+    insert_alerts(db, pending)
     db.commit()
-    return sent_count
+    return len(pending)
 
 
-def run_task_alerts() -> None:
+def upcoming_notify_times(db, now: datetime, until: datetime) -> list[datetime]:
+    rows = (
+        db.query(models.Task.next_notify_at)
+        .filter(models.Task.next_notify_at > now, models.Task.next_notify_at <= until)
+        .all()
+    )
+    return [row[0] for row in rows]
+
+
+def run_task_alerts() -> int:
     db = SessionLocal()
     try:
-        process_task_alerts(db)
+        return process_task_alerts(db)
     finally:
         db.close()
+
+
+if __name__ == "__main__":
+    print(f"Sent {run_task_alerts()} task alerts")
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from app.core.config import get_settings
+from app.db import SessionLocal
+from app.services.task_alerts import run_task_alerts, upcoming_notify_times
+
+logger = logging.getLogger(__name__)
+
+
+def _next_midnight(now: datetime) -> datetime:
+    return datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+
+
+class TaskAlertScheduler:
+    def __init__(self, resync_seconds: float = 300) -> None:
+        self.resync_interval = timedelta(seconds=resync_seconds)
+        self._heap: list[datetime] = []
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._next_resync = datetime.min
+        self._next_sweep = datetime.min
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._next_resync = datetime.min
+            self._thread = threading.Thread(target=self._run, name="task-alert-scheduler", daemon=True)
+            self._thread.start()
+
+    def schedule(self, notify_at: datetime | None) -> None:
+        if notify_at is None:
+            return
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                return
+            heapq.heappush(self._heap, notify_at)
+            self._condition.notify_all()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    now = datetime.utcnow()
+                    wake = min(self._next_resync, self._next_sweep)
+                    if self._heap:
+                        wake = min(wake, self._heap[0])
+                    if wake <= now:
+                        break
+                    self._condition.wait((wake - now).total_seconds())
+                if self._stopping:
+                    return
+                while self._heap and self._heap[0] <= now:
+                    heapq.heappop(self._heap)
+                resync = now >= self._next_resync
+
+            self._fire(now)
+            if resync:
+                self._resync(now)
+
+    def _fire(self, now: datetime) -> None:
+        # A single pass sends every due alert and applies the overdue
+        # transitions, so stale heap entries only cost an empty pass.
+        try:
+            run_task_alerts()
+        except Exception:
+            logger.exception("Task alert pass failed")
+        self._next_sweep = _next_midnight(now)
+
+    def _resync(self, now: datetime) -> None:
+        # Only the next resync window is kept in memory; writes in this
+        # process push their own entries through schedule().
+        until = now + self.resync_interval
+        db = SessionLocal()
+        try:
+            times = upcoming_notify_times(db, now, until)
+        except Exception:
+            logger.exception("Task alert resync failed")
+            times = []
+        finally:
+            db.close()
+        with self._condition:
+            self._heap = [t for t in self._heap if now < t <= until] + times
+            heapq.heapify(self._heap)
+            self._next_resync = until
+
+
+task_scheduler = TaskAlertScheduler(resync_seconds=get_settings().task_scheduler_resync_seconds)
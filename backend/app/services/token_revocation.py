@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Tuple
+
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.config import get_settings
+from app.db import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+BLOOM_FALSE_POSITIVE_RATE = 0.01
+BLOOM_MIN_CAPACITY = 1024
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = BLOOM_FALSE_POSITIVE_RATE) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class TokenRevocationStore:
+    # Revoked jtis live in a Bloom filter rebuilt from the database by a
+    # background refresh; a hit is confirmed against the recent local
+    # revocations or the database. Per-user cutoffs are few, so they are kept
+    # exactly. Requests only read the in-memory state, so the async read path
+    # never waits on the sync engine.
+    #
+    # Local revocations are recorded in memory before the caller commits, so
+    # they are also kept as pending until a refresh reads them back from the
+    # database (or they expire); a refresh merges pending entries into its
+    # snapshot instead of dropping them.
+    def __init__(self, refresh_seconds: float = 10) -> None:
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(BLOOM_MIN_CAPACITY)
+        self._recent: set[str] = set()
+        self._cutoffs: Dict[int, int] = {}
+        self._pending_jtis: Dict[str, datetime] = {}
+        self._pending_cutoffs: Dict[int, Tuple[int, datetime]] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    def refresh(self) -> None:
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            db.query(models.RevokedToken).filter(models.RevokedToken.expires_at <= now).delete(
+                synchronize_session=False
+            )
+            db.commit()
+            rows = (
+                db.query(
+                    models.RevokedToken.jti,
+                    models.RevokedToken.user_id,
+                    models.RevokedToken.issued_before,
+                )
+                .filter(models.RevokedToken.expires_at > now)
+                .all()
+            )
+        finally:
+            db.close()
+
+        jtis = {jti for jti, _, _ in rows if jti}
+        cutoffs: Dict[int, int] = {}
+        for _, user_id, issued_before in rows:
+            if user_id is not None and issued_before is not None:
+                cutoffs[user_id] = max(cutoffs.get(user_id, 0), _epoch_us(issued_before))
+
+        with self._lock:
+            # Pending entries the snapshot already holds, or that have expired,
+            # are settled; the rest are not committed yet and carry over.
+            self._pending_jtis = {
+                jti: expires_at
+                for jti, expires_at in self._pending_jtis.items()
+                if jti not in jtis and expires_at > now
+            }
+            self._pending_cutoffs = {
+                user_id: (cutoff, expires_at)
+                for user_id, (cutoff, expires_at) in self._pending_cutoffs.items()
+                if cutoff > cutoffs.get(user_id, 0) and expires_at > now
+            }
+            bloom = BloomFilter(max((len(jtis) + len(self._pending_jtis)) * 2, BLOOM_MIN_CAPACITY))
+            for jti in jtis:
+                bloom.add(jti)
+            for jti in self._pending_jtis:
+                bloom.add(jti)
+            for user_id, (cutoff, _) in self._pending_cutoffs.items():
+                cutoffs[user_id] = max(cutoffs.get(user_id, 0), cutoff)
+            self._bloom = bloom
+            self._recent = set(self._pending_jtis)
+            self._cutoffs = cutoffs
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="token-revocation-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._stopping:
+                    self._condition.wait(self.refresh_seconds)
+                if self._stopping:
+                    return
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Token revocation refresh failed")
+
+    def is_revoked(self, db: Session, payload: Dict[str, Any], user_id: int) -> bool:
+        with self._lock:
+            cutoff = self._cutoffs.get(user_id)
+            bloom = self._bloom
+            recent = self._recent
+
+        if cutoff is not None and _issued_at_us(payload) <= cutoff:
+            return True
+
+        jti = payload.get("jti")
+        if not jti or jti not in bloom:
+            return False
+        if jti in recent:
+            return True
+        return db.query(models.RevokedToken.id).filter(models.RevokedToken.jti == jti).first() is not None
+
+    def revoke_token(self, db: Session, payload: Dict[str, Any]) -> None:
+        jti = payload.get("jti")
+        if not jti:
+            return
+        expires_at = datetime.utcfromtimestamp(payload["exp"]) if "exp" in payload else _max_expiry()
+        if db.query(models.RevokedToken.id).filter(models.RevokedToken.jti == jti).first() is None:
+            db.add(models.RevokedToken(jti=jti, user_id=payload.get("uid"), expires_at=expires_at))
+        with self._lock:
+            self._bloom.add(jti)
+            self._recent.add(jti)
+            self._pending_jtis[jti] = expires_at
+
+    def revoke_user_tokens(self, db: Session, user_id: int) -> None:
+        issued_before = datetime.utcnow()
+        expires_at = issued_before + _token_lifetime()
+        db.add(models.RevokedToken(user_id=user_id, issued_before=issued_before, expires_at=expires_at))
+        cutoff = _epoch_us(issued_before)
+        with self._lock:
+            self._cutoffs[user_id] = max(self._cutoffs.get(user_id, 0), cutoff)
+            pending, _ = self._pending_cutoffs.get(user_id, (0, expires_at))
+            self._pending_cutoffs[user_id] = (max(pending, cutoff), expires_at)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "bloom_bits": self._bloom.size,
+                "bloom_hashes": self._bloom.hash_count,
+                "recent_revocations": len(self._recent),
+                "user_cutoffs": len(self._cutoffs),
+                "pending_revocations": len(self._pending_jtis) + len(self._pending_cutoffs),
+                "refresh_seconds": self.refresh_seconds,
+            }
+
+
+def _epoch_us(value: datetime) -> int:
+    return (value - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+
+
+def _issued_at_us(payload: Dict[str, Any]) -> int:
+    # JWT iat only has whole seconds, so tokens carry iat_us as well. Tokens
+    # without it count from the start of their iat second, and tokens minted
+    # before revocation existed have neither and predate any cutoff.
+    if "iat_us" in payload:
+        return int(payload["iat_us"])
+    return int(payload.get("iat", 0)) * 1_000_000
+
+
+def _token_lifetime() -> timedelta:
+    return timedelta(minutes=get_settings().access_token_expire_minutes)
+
+
+def _max_expiry() -> datetime:
+    return datetime.utcnow() + _token_lifetime()
+
+
+revocation_store = TokenRevocationStore(refresh_seconds=get_settings().token_revocation_refresh_seconds)
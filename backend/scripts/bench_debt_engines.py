@@ -0,0 +1,70 @@
+# Times the debt payoff engines on large random portfolios and checks that
+# the NumPy engine reproduces the loop engine exactly. For example:
+#
+#     python -m scripts.bench_debt_engines --debts 50 100 200 --repeat 5
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from dataclasses import replace
+
+from app.services.debt import DebtItem, simulate_payoff
+
+ENGINES = ("loop", "numpy", "event")
+
+
+def random_portfolio(count: int, rng: random.Random) -> list[DebtItem]:
+    debts = []
+    for index in range(count):
+        balance = round(rng.uniform(500, 40000), 2)
+        apr = round(rng.choice([0, rng.uniform(2, 30)]), 2)
+        # Keep every debt amortizing so runs end well before MAX_MONTHS.
+        minimum = round(balance * (apr / 100 / 12) + rng.uniform(20, 400), 2)
+        debts.append(DebtItem(index + 1, f"debt {index + 1}", balance, apr, minimum, 0.0))
+    return debts
+
+
+def time_engine(debts, strategy, extra, engine, repeat) -> tuple[float, dict]:
+    samples = []
+    result = {}
+    for _ in range(repeat):
+        copies = [replace(d) for d in debts]
+        started = time.perf_counter()
+        result = simulate_payoff(copies, strategy, extra, engine=engine)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the debt payoff engines.")
+    parser.add_argument("--debts", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--strategy", default="avalanche", choices=["avalanche", "snowball", "custom"])
+    parser.add_argument("--extra", type=float, default=500.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'debts':>6} {'months':>7} " + " ".join(f"{engine + ' ms':>10}" for engine in ENGINES) + "  numpy==loop")
+    for count in args.debts:
+        debts = random_portfolio(count, rng)
+        timings = {}
+        results = {}
+        for engine in ENGINES:
+            timings[engine], results[engine] = time_engine(debts, args.strategy, args.extra, engine, args.repeat)
+        same = (
+            results["numpy"]["payoff_schedule"] == results["loop"]["payoff_schedule"]
+            and results["numpy"]["total_interest"] == results["loop"]["total_interest"]
+        )
+        print(
+            f"{count:>6} {results['loop']['total_months']:>7} "
+            + " ".join(f"{timings[engine] * 1000:>10.1f}" for engine in ENGINES)
+            + f"  {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
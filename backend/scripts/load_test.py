@@ -0,0 +1,98 @@
+# Concurrent GET load test for comparing the sync and async API stacks.
+# Start the API with DB_ASYNC_ENABLED unset, then set, and run for example:
+#
+#     python scripts/load_test.py --username bob --password secret1 \
+#         --path /expenses --concurrency 200 --requests 4000
+#
+# With METRICS_ENABLED=true on the server it also prints the most statements
+# the server had executing at once; the sync stack cannot exceed its 40
+# threadpool workers there. Size DB_POOL_SIZE/DB_MAX_OVERFLOW above that.
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        response = await client.post(
+            "/auth/login", json={"username": args.username, "password": args.password}
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        latencies: list[float] = []
+        errors = 0
+        in_flight = 0
+        peak_in_flight = 0
+        remaining = args.requests
+
+        async def worker() -> None:
+            nonlocal errors, in_flight, peak_in_flight, remaining
+            while remaining > 0:
+                remaining -= 1
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+                started = time.perf_counter()
+                try:
+                    result = await client.get(args.path, headers=headers)
+                    if result.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                finally:
+                    in_flight -= 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+        server_peaks = await fetch_server_peaks(client, args.metrics_token)
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"requests={len(latencies)} errors={errors} concurrency={args.concurrency} peak_in_flight={peak_in_flight}")
+    print(f"throughput={len(latencies) / elapsed:.1f} req/s elapsed={elapsed:.2f}s")
+    print(
+        f"latency_ms p50={quantiles[49] * 1000:.1f} p95={quantiles[94] * 1000:.1f} "
+        f"p99={quantiles[98] * 1000:.1f} max={latencies[-1] * 1000:.1f}"
+    )
+    if server_peaks:
+        # Client-side in-flight is capped by --concurrency; this is how many
+        # statements the server actually had executing at once.
+        print("server_statements_in_flight_max " + " ".join(f"{k}={v}" for k, v in server_peaks.items()))
+
+
+async def fetch_server_peaks(client: httpx.AsyncClient, token: str | None) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = await client.get("/metrics", headers=headers)
+    if response.status_code != 200:
+        return {}
+    peaks = {}
+    for line in response.text.splitlines():
+        name, _, value = line.rpartition(" ")
+        if name.startswith("db_statements_in_flight_max"):
+            peaks[name.partition("engine=")[2].strip('"}')] = int(float(value))
+    return peaks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent GET load test for the API.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--path", default="/budget/summary")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--metrics-token", help="METRICS_TOKEN of the server, if set")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
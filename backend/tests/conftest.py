@@ -0,0 +1,110 @@
+import os
+import tempfile
+
+# The app builds its engine from settings at import time; point it at a
+# throwaway database before anything under app/ is imported.
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/app.db"
+# Evaluate alerts inside the request and keep the task scheduler idle.
+os.environ["ALERT_QUEUE_ENABLED"] = "false"
+os.environ["TASK_SCHEDULER_ENABLED"] = "false"
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.db import Base
+from app.db import engine as app_engine
+from app.services.principal_cache import clear_principal_cache
+from app.services.summary_cache import clear_summary_cache
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def engine(request, tmp_path):
+    if request.param == "postgresql":
+        if not POSTGRES_URL:
+            pytest.skip("TEST_POSTGRES_URL is not set")
+        engine = create_engine(POSTGRES_URL)
+    else:
+        engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+@pytest.fixture
+def user(db):
+    user = models.User(username="planner", full_name="Plan Ner", gender="N/A", password_hash="x")
+    db.add(user)
+    db.flush()
+    return user
+
+
+@pytest.fixture
+def statements(engine):
+    captured: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    Base.metadata.create_all(app_engine)
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        clear_principal_cache()
+        clear_summary_cache()
+        Base.metadata.drop_all(app_engine)
+
+
+@pytest.fixture
+def register(client):
+    def register(username: str, password: str = "secret1") -> dict:
+        response = client.post(
+            "/auth/register",
+            json={
+                "username": username,
+                "password": password,
+                "full_name": username.title(),
+                "gender": "N/A",
+                "country": "USA",
+            },
+        )
+        assert response.status_code == 200, response.text
+        return login(client, username, password)
+
+    return register
+
+
+def login(client, username: str, password: str) -> dict:
+    response = client.post("/auth/login", json={"username": username, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,64 @@
+from datetime import date, datetime
+
+from sqlalchemy import func
+
+from app import models
+from app.services.alerts import insert_alerts, maybe_create_alerts
+from app.services.expense_rollups import record_expense
+from app.services.summary_cache import clear_summary_cache
+from app.services.task_alerts import process_task_alerts
+
+YEAR, MONTH = 2026, 3
+
+
+def _counts(db, user_id):
+    rows = (
+        db.query(models.Alert.code, models.Alert.year, models.Alert.month, func.count(models.Alert.id))
+        .filter(models.Alert.user_id == user_id)
+        .group_by(models.Alert.code, models.Alert.year, models.Alert.month)
+        .all()
+    )
+    return {(code, year, month): count for code, year, month, count in rows}
+
+
+def test_insert_alerts_twice_keeps_one_row_per_code(db, user):
+    rows = [
+        {"user_id": user.id, "year": YEAR, "month": MONTH, "code": code, "level": "alert", "message": code}
+        for code in ("pace-2026-3", "cat-1-100-2026-3", "pace-2026-3")
+    ]
+    insert_alerts(db, rows)
+    db.commit()
+    insert_alerts(db, rows)
+    db.commit()
+
+    assert _counts(db, user.id) == {("pace-2026-3", YEAR, MONTH): 1, ("cat-1-100-2026-3", YEAR, MONTH): 1}
+
+
+def test_alert_passes_run_twice_keep_one_row_per_code(db, user):
+    category = models.Category(user_id=user.id, name="Groceries", monthly_limit=100, tag="regular")
+    db.add(category)
+    db.flush()
+    expense = models.Expense(user_id=user.id, category_id=category.id, amount=120, date=date(YEAR, MONTH, 2))
+    db.add(expense)
+    record_expense(db, expense)
+    db.add(models.BudgetMonth(user_id=user.id, year=YEAR, month=MONTH, salary=100))
+    notify_at = datetime(YEAR, MONTH, 4, 9, 0)
+    task = models.Task(user_id=user.id, title="rent", due_date=date(YEAR, MONTH, 5), next_notify_at=notify_at)
+    db.add(task)
+    db.commit()
+
+    clear_summary_cache()
+    for _ in range(2):
+        maybe_create_alerts(db, user.id, YEAR, MONTH)
+        # A second scheduler worker that read the task before the first one
+        # cleared next_notify_at sends the same alert again.
+        task.next_notify_at = notify_at
+        db.commit()
+        process_task_alerts(db, user.id, now=datetime(YEAR, MONTH, 4, 9, 30))
+    clear_summary_cache()
+
+    assert _counts(db, user.id) == {
+        (f"cat-{category.id}-100-{YEAR}-{MONTH}", YEAR, MONTH): 1,
+        (f"pace-{YEAR}-{MONTH}", YEAR, MONTH): 1,
+        (f"TASK_ALERT-{task.id}-202603040900", YEAR, MONTH): 1,
+    }
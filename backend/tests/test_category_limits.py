@@ -0,0 +1,59 @@
+import pytest
+
+from app import models
+from app.services.budget import compute_budget_summary
+from app.services.category_limits import get_monthly_limits
+
+
+def _add_categories(db, user, count):
+    categories = [
+        models.Category(user_id=user.id, name=f"category {index}", monthly_limit=50)
+        for index in range(count)
+    ]
+    db.add_all(categories)
+    db.flush()
+    for index, category in enumerate(categories):
+        # A mix of limits set this month, set in earlier months and never set.
+        if index % 3 == 0:
+            continue
+        for year, month in [(2025, 11), (2026, 1), (2026, 4)][: index % 3 + 1]:
+            db.add(
+                models.CategoryLimit(
+                    user_id=user.id,
+                    category_id=category.id,
+                    year=year,
+                    month=month,
+                    monthly_limit=100 * index + month,
+                )
+            )
+    db.commit()
+    return [category.id for category in categories]
+
+
+@pytest.mark.parametrize("count", [1, 10, 40])
+def test_monthly_limits_use_one_statement(db, user, statements, count):
+    category_ids = _add_categories(db, user, count)
+    user_id = user.id
+    statements.clear()
+
+    limits = get_monthly_limits(db, user_id, 2026, 3, category_ids)
+
+    assert len(statements) == 1
+    for index, category_id in enumerate(category_ids):
+        if index % 3 == 0:
+            assert category_id not in limits
+        else:
+            # The latest limit at or before March 2026: January, never April.
+            assert limits[category_id] == 100 * index + 1
+
+
+def test_budget_summary_round_trips_do_not_grow_with_categories(db, user, statements):
+    round_trips = []
+    for added in (2, 28):
+        _add_categories(db, user, added)
+        user_id = user.id
+        statements.clear()
+        compute_budget_summary(db, user_id, 2026, 3)
+        round_trips.append(len(statements))
+
+    assert round_trips[0] == round_trips[1]
@@ -0,0 +1,81 @@
+from dataclasses import replace
+
+import pytest
+
+from app.core.config import get_settings
+from app.services.debt import DebtItem, simulate_payoff
+from app.services.debt_compare import get_simulation_pool, shutdown_sweep_pool
+from app.services.debt_montecarlo import TRIALS_PER_CHUNK, simulate_payoff_monte_carlo
+
+DEBTS = [
+    DebtItem(1, "card", 5200.0, 22.9, 140.0, 0.0),
+    DebtItem(2, "car", 11800.0, 6.4, 260.0, 25.0),
+    DebtItem(3, "loan", 2500.0, 0.0, 90.0, 0.0),
+]
+TRIALS = TRIALS_PER_CHUNK * 2 + 500
+
+
+def _run(strategy="avalanche", **kwargs):
+    options = {"trials": TRIALS, "seed": 1234, "cpu_budget_seconds": 60.0, **kwargs}
+    return simulate_payoff_monte_carlo([replace(d) for d in DEBTS], strategy, 150.0, **options)
+
+
+@pytest.fixture
+def sweep_pool(monkeypatch):
+    monkeypatch.setattr(get_settings(), "debt_sweep_workers", 2)
+    try:
+        yield
+    finally:
+        shutdown_sweep_pool()
+
+
+def test_seed_is_reproducible_in_process():
+    assert _run() == _run()
+
+
+def test_seed_is_reproducible_on_the_pool(sweep_pool, monkeypatch):
+    assert get_simulation_pool() is not None
+    pooled = _run()
+
+    assert _run() == pooled
+    # Chunking depends only on the trial count, so the pool changes nothing.
+    shutdown_sweep_pool()
+    monkeypatch.setattr(get_settings(), "debt_sweep_workers", 0)
+    assert get_simulation_pool() is None
+    assert _run() == pooled
+
+
+@pytest.mark.parametrize("strategy", ["avalanche", "snowball", "custom"])
+def test_zero_volatility_matches_simulate_payoff(strategy):
+    result = _run(strategy, trials=50, apr_volatility=0.0, extra_volatility=0.0, order=[3, 1, 2])
+    expected = simulate_payoff([replace(d) for d in DEBTS], strategy, 150.0, order=[3, 1, 2])
+
+    assert result["total_months"] == {p: float(expected["total_months"]) for p in ("p10", "p50", "p90")}
+    for simulated, item in zip(result["payoff_schedule"], expected["payoff_schedule"]):
+        assert simulated["debt_id"] == item["debt_id"]
+        assert set(simulated["payoff_months"].values()) == {item["payoff_months"]}
+        assert simulated["unpaid_share"] == 0
+    for value in result["total_interest"].values():
+        assert value == pytest.approx(expected["total_interest"], abs=0.01)
+
+
+def test_exceeding_cpu_budget_returns_422(client, register, monkeypatch):
+    headers = register("montecarlo")
+    for d in DEBTS:
+        response = client.post(
+            "/debts",
+            json={
+                "debt_name": d.name,
+                "total_balance": d.balance,
+                "apr": d.apr,
+                "minimum_monthly_payment": d.minimum,
+            },
+            headers=headers,
+        )
+        assert response.status_code == 200, response.text
+    monkeypatch.setattr(get_settings(), "debt_monte_carlo_cpu_seconds", 1e-6)
+
+    response = client.post("/debts/monte-carlo", json={"trials": 5000, "seed": 7}, headers=headers)
+
+    assert response.status_code == 422
+    assert "CPU budget" in response.json()["detail"]
@@ -0,0 +1,106 @@
+from datetime import date
+
+from app import models
+from app.db import SessionLocal
+from app.services.expense_rollups import record_expense, remove_expense, verify_rollups
+
+
+def _rollups(db, user_id):
+    return {
+        (row.year, row.month, row.category_id): (float(row.total), row.count)
+        for row in db.query(models.ExpenseMonthRollup).filter(
+            models.ExpenseMonthRollup.user_id == user_id
+        )
+    }
+
+
+def _add_uncategorized(db, user_id, amount, day):
+    # Rows from before every expense had a category keep category_id NULL.
+    expense = models.Expense(user_id=user_id, category_id=None, amount=amount, date=date(2026, 3, day))
+    db.add(expense)
+    record_expense(db, expense)
+    db.commit()
+    return expense.id
+
+
+def test_rollups_follow_expense_writes(client, register):
+    headers = register("carol")
+    groceries, rent = (
+        client.post("/categories", json={"name": name, "monthly_limit": 500}, headers=headers).json()["id"]
+        for name in ("Groceries", "Rent")
+    )
+    created = [
+        client.post("/expenses", json=body, headers=headers).json()["id"]
+        for body in (
+            {"amount": 40, "category_id": groceries, "date": "2026-03-02"},
+            {"amount": 25.5, "category_id": groceries, "date": "2026-03-09"},
+            {"amount": 900, "category_id": rent, "date": "2026-03-01"},
+            {"amount": 12, "date": "2026-04-03"},
+        )
+    ]
+    response = client.post(
+        "/expenses/bulk",
+        json=[
+            {"amount": 30, "category_id": groceries, "date": "2026-03-15"},
+            {"amount": 950, "category": "rent", "date": "2026-04-01"},
+            {"amount": 7.25, "date": "2026-04-20"},
+            {"amount": "lots", "date": "2026-04-21"},
+        ],
+        headers=headers,
+    )
+    assert response.json()["inserted"] == 3
+
+    db = SessionLocal()
+    try:
+        user_id = db.query(models.User.id).filter(models.User.username == "carol").scalar()
+        legacy = [_add_uncategorized(db, user_id, amount, day) for amount, day in ((5, 4), (6, 5))]
+        assert _rollups(db, user_id)[(2026, 3, None)] == (11.0, 2)
+
+        assert client.delete(f"/expenses/{created[0]}", headers=headers).status_code == 200
+        assert client.delete(f"/expenses/{legacy[0]}", headers=headers).status_code == 200
+        moved = client.post(
+            f"/categories/{rent}/delete", json={"replacement_category_id": groceries}, headers=headers
+        )
+        assert moved.json()["moved_to"] == groceries
+        uncategorized = client.post(f"/categories/{groceries}/delete", json={}, headers=headers).json()[
+            "moved_to"
+        ]
+
+        db.expire_all()
+        assert verify_rollups(db, user_id) == []
+        rollups = _rollups(db, user_id)
+        assert rollups[(2026, 3, None)] == (6.0, 1)
+        assert rollups[(2026, 3, uncategorized)] == (955.5, 3)
+        assert not {key for key in rollups if key[2] in (groceries, rent)}
+
+        # The last uncategorized expense of the month takes its rollup row with it.
+        assert client.delete(f"/expenses/{legacy[1]}", headers=headers).status_code == 200
+        db.expire_all()
+        assert verify_rollups(db, user_id) == []
+        rollups = _rollups(db, user_id)
+        assert (2026, 3, None) not in rollups
+        assert all(count > 0 for _, count in rollups.values())
+    finally:
+        db.close()
+
+
+def test_uncategorized_rollup_upserts_into_one_row(db, user):
+    expenses = [
+        models.Expense(user_id=user.id, category_id=None, amount=amount, date=date(2026, 5, 10))
+        for amount in (15, 20)
+    ]
+    for expense in expenses:
+        db.add(expense)
+        record_expense(db, expense)
+    db.commit()
+
+    assert _rollups(db, user.id) == {(2026, 5, None): (35.0, 2)}
+    assert verify_rollups(db, user.id) == []
+
+    for expense in expenses:
+        remove_expense(db, expense)
+        db.delete(expense)
+    db.commit()
+
+    assert _rollups(db, user.id) == {}
+    assert verify_rollups(db, user.id) == []
@@ -0,0 +1,83 @@
+import base64
+import json
+
+import pytest
+
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.core.config import get_settings
+
+PARAMS = {"year": 2026, "month": 3}
+
+
+@pytest.fixture
+def headers(client, register):
+    headers = register("dora")
+    # Most rows share a date, so the id is what keeps pages apart.
+    days = [10] * 7 + [3, 21, 28]
+    response = client.post(
+        "/expenses/bulk",
+        json=[{"amount": index + 1, "date": f"2026-03-{day:02d}"} for index, day in enumerate(days)],
+        headers=headers,
+    )
+    assert response.json()["inserted"] == len(days)
+    return headers
+
+
+def _cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+
+def test_without_paging_parameters_returns_bare_list(client, headers):
+    response = client.get("/expenses", params=PARAMS, headers=headers)
+
+    assert NEXT_CURSOR_HEADER not in response.headers
+    rows = response.json()
+    assert len(rows) == 10
+    assert [(row["date"], row["id"]) for row in rows] == sorted(
+        ((row["date"], row["id"]) for row in rows), reverse=True
+    )
+
+
+def test_pages_walk_ties_without_gaps_or_repeats(client, headers):
+    expected = [row["id"] for row in client.get("/expenses", params=PARAMS, headers=headers).json()]
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {**PARAMS, "limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/expenses", params=params, headers=headers)
+        assert response.status_code == 200
+        seen += [row["id"] for row in response.json()]
+        pages += 1
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert pages == 4
+
+
+def test_last_full_page_has_no_next_cursor(client, headers):
+    response = client.get("/expenses", params={**PARAMS, "limit": 10}, headers=headers)
+
+    assert len(response.json()) == 10
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_limit_is_clamped_to_page_size_max(client, headers, monkeypatch):
+    monkeypatch.setattr(get_settings(), "page_size_max", 4)
+
+    response = client.get("/expenses", params={**PARAMS, "limit": 500}, headers=headers)
+
+    assert len(response.json()) == 4
+    assert NEXT_CURSOR_HEADER in response.headers
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not a cursor", _cursor({"date": "2026-03-10"}), _cursor(["2026-03-10"]), _cursor(["March", 4])],
+    ids=["not-base64-json", "not-a-list", "wrong-length", "bad-date"],
+)
+def test_malformed_cursor_is_rejected(client, headers, cursor):
+    response = client.get("/expenses", params={**PARAMS, "cursor": cursor}, headers=headers)
+
+    assert response.status_code == 400
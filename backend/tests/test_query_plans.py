@@ -0,0 +1,133 @@
+import re
+from datetime import date
+
+import pytest
+from fastapi import Response
+from sqlalchemy import text
+
+from app import models
+from app.api.pagination import paginate
+from app.db import Base
+from app.services.alerts import maybe_create_category_alerts
+from app.services.budget import compute_budget_summary, get_month_total_spent, get_planned_savings
+from app.services.category_limits import get_monthly_limits
+from app.services.expense_rollups import record_expense
+from app.services.read_queries import (
+    ALERT_PAGE_COLUMNS,
+    EXPENSE_PAGE_COLUMNS,
+    TASK_PAGE_COLUMNS,
+    alerts_query,
+    debts_query,
+    expenses_query,
+    tasks_query,
+)
+
+YEAR, MONTH = 2026, 3
+TABLES = set(Base.metadata.tables)
+
+
+@pytest.fixture
+def seeded(db, user):
+    categories = [
+        models.Category(user_id=user.id, name=name, monthly_limit=100, tag=tag)
+        for name, tag in [("Groceries", "regular"), ("Rent", "regular"), ("Rainy day", "savings")]
+    ]
+    db.add_all(categories)
+    db.flush()
+    for category in categories:
+        db.add(
+            models.CategoryLimit(
+                user_id=user.id, category_id=category.id, year=YEAR, month=1, monthly_limit=150
+            )
+        )
+        expense = models.Expense(
+            user_id=user.id, category_id=category.id, amount=120, date=date(YEAR, MONTH, 2)
+        )
+        db.add(expense)
+        record_expense(db, expense)
+    db.add(models.BudgetMonth(user_id=user.id, year=YEAR, month=MONTH, salary=1000))
+    for day in (5, 20):
+        db.add(models.Task(user_id=user.id, title=f"pay on {day}", due_date=date(YEAR, MONTH, day)))
+    for code in ("month_over_budget", "pace_over_income"):
+        db.add(
+            models.Alert(
+                user_id=user.id, year=YEAR, month=MONTH, code=code, level="warning", message=code
+            )
+        )
+    db.add(models.Debt(user_id=user.id, debt_name="card", total_balance=900, minimum_monthly_payment=40))
+    db.commit()
+    return user, categories
+
+
+def _full_scans(db, statement, parameters) -> list[str]:
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        # "SCAN <table>" without "USING ... INDEX" walks every row of the table.
+        return [
+            row[-1]
+            for row in rows
+            if (match := re.fullmatch(r"SCAN (?:TABLE )?(\w+)", row[-1])) and match.group(1) in TABLES
+        ]
+
+    # Tiny test tables make a sequential scan the cheapest plan, so take it off
+    # the table: a "Seq Scan" that remains means no usable index exists.
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    rows = db.connection().exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+    return [row[0].strip() for row in rows if "Seq Scan on" in row[0]]
+
+
+def _assert_indexed(db, statements, run):
+    statements.clear()
+    run()
+    selects = [(s, p) for s, p in statements if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+    assert selects, "hot path issued no queries"
+    for statement, parameters in selects:
+        scans = _full_scans(db, statement, parameters)
+        assert not scans, f"full table scan {scans} for:\n{statement}"
+
+
+def test_budget_summary_uses_indexes(db, seeded, statements):
+    user, _ = seeded
+    _assert_indexed(db, statements, lambda: compute_budget_summary(db, user.id, YEAR, MONTH))
+    _assert_indexed(db, statements, lambda: get_month_total_spent(db, user.id, YEAR, MONTH))
+    _assert_indexed(db, statements, lambda: get_planned_savings(db, user.id, YEAR, MONTH))
+
+
+def test_monthly_limits_use_index(db, seeded, statements):
+    user, categories = seeded
+    ids = [c.id for c in categories]
+    _assert_indexed(db, statements, lambda: get_monthly_limits(db, user.id, YEAR, MONTH, ids))
+
+
+def test_category_alerts_use_indexes(db, seeded, statements):
+    user, categories = seeded
+    _assert_indexed(
+        db,
+        statements,
+        lambda: maybe_create_category_alerts(db, user.id, YEAR, MONTH, categories[0].id, 120),
+    )
+
+
+@pytest.mark.parametrize(
+    "build, columns",
+    [
+        (lambda db, user_id: expenses_query(db, user_id, YEAR, MONTH), EXPENSE_PAGE_COLUMNS),
+        (lambda db, user_id: alerts_query(db, user_id, YEAR, MONTH), ALERT_PAGE_COLUMNS),
+        (lambda db, user_id: tasks_query(db, user_id, YEAR, MONTH), TASK_PAGE_COLUMNS),
+    ],
+    ids=["expenses", "alerts", "tasks"],
+)
+def test_list_pages_use_indexes(db, seeded, statements, build, columns):
+    user, _ = seeded
+    first = Response()
+    _assert_indexed(db, statements, lambda: paginate(build(db, user.id), first, columns, None, 1))
+    cursor = first.headers["X-Next-Cursor"]
+    _assert_indexed(
+        db, statements, lambda: paginate(build(db, user.id), Response(), columns, cursor, 1)
+    )
+
+
+def test_debt_list_uses_index(db, seeded, statements):
+    user, _ = seeded
+    _assert_indexed(db, statements, lambda: debts_query(db, user.id).all())
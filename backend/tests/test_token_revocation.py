@@ -0,0 +1,105 @@
+from app.core.config import get_settings
+from app.core.security import create_access_token, decode_access_token
+from app.db import SessionLocal
+from app.services.token_revocation import TokenRevocationStore
+
+from conftest import login
+
+
+def _admin(client) -> dict:
+    settings = get_settings()
+    return login(client, settings.admin_username, settings.admin_password)
+
+
+def _payload(headers: dict) -> dict:
+    return decode_access_token(headers["Authorization"].split(" ", 1)[1])
+
+
+def test_logout_revokes_token(client, register):
+    headers = register("alice")
+    other = login(client, "alice", "secret1")
+
+    assert client.post("/auth/logout", headers=headers).status_code == 200
+
+    assert client.get("/auth/me", headers=headers).status_code == 401
+    assert client.get("/auth/me", headers=other).status_code == 200
+
+
+def test_admin_reset_revokes_tokens_from_the_same_second(client, register):
+    headers = register("bob")
+    admin = _admin(client)
+    client.post("/auth/forgot-password", json={"username": "bob"})
+    request_id = client.get("/admin/password-resets", headers=admin).json()[0]["id"]
+
+    response = client.post(
+        f"/admin/password-resets/{request_id}/reset", json={"new_password": "secret2"}, headers=admin
+    )
+    assert response.status_code == 200
+    fresh = login(client, "bob", "secret2")
+
+    # Login, reset and the new login usually share a second of JWT iat.
+    assert client.get("/auth/me", headers=headers).status_code == 401
+    assert client.get("/auth/me", headers=fresh).status_code == 200
+
+
+def test_deleted_user_tokens_are_revoked(client, register):
+    headers = register("carol")
+    user_id = client.get("/auth/me", headers=headers).json()["id"]
+
+    assert client.delete(f"/admin/users/{user_id}", headers=_admin(client)).status_code == 200
+
+    assert client.get("/auth/me", headers=headers).status_code == 401
+    register("carol")
+    assert client.get("/auth/me", headers=headers).status_code == 401
+
+
+def test_user_cutoff_has_sub_second_precision(client, register):
+    user_id = _payload(register("dave"))["uid"]
+    store = TokenRevocationStore()
+    db = SessionLocal()
+    try:
+        # Microseconds apart, so almost always within the same second of iat.
+        before = decode_access_token(create_access_token("dave", user_id=user_id))
+        store.revoke_user_tokens(db, user_id)
+        after = decode_access_token(create_access_token("dave", user_id=user_id))
+        db.commit()
+
+        assert store.is_revoked(db, before, user_id)
+        assert not store.is_revoked(db, after, user_id)
+    finally:
+        db.close()
+
+
+def test_refresh_before_commit_keeps_logout(client, register):
+    payload = _payload(register("erin"))
+    store = TokenRevocationStore()
+    db = SessionLocal()
+    try:
+        store.revoke_token(db, payload)
+        # A background refresh lands between the in-memory write and the commit.
+        store.refresh()
+        assert store.is_revoked(db, payload, payload["uid"])
+        db.commit()
+
+        store.refresh()
+        assert store.is_revoked(db, payload, payload["uid"])
+    finally:
+        db.close()
+    assert store.stats()["pending_revocations"] == 0
+
+
+def test_refresh_before_commit_keeps_user_cutoff(client, register):
+    payload = _payload(register("frank"))
+    store = TokenRevocationStore()
+    db = SessionLocal()
+    try:
+        store.revoke_user_tokens(db, payload["uid"])
+        store.refresh()
+        assert store.is_revoked(db, payload, payload["uid"])
+        db.commit()
+
+        store.refresh()
+        assert store.is_revoked(db, payload, payload["uid"])
+    finally:
+        db.close()
+    assert store.stats()["pending_revocations"] == 0